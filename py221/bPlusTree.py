@@ -0,0 +1,451 @@
+import unittest
+import random
+from bisect import bisect_left, bisect_right
+
+class LeafNode:
+    """
+    Leaf Node implementation for B+ Tree, holding the sorted values with their data and
+    a link to the next leaf for range scans
+    """
+    def __init__(self, values=None, data=None, next=None):
+        self.values = values if values != None else []
+        self.data = data if data != None else []
+        self.next = next
+
+class InternalNode:
+    """
+    Internal Node implementation for B+ Tree, where children[i] holds the values in
+    [values[i - 1], values[i])
+    """
+    def __init__(self, values=None, children=None):
+        self.values = values if values != None else []
+        self.children = children if children != None else []
+
+class BPlusTree:
+    """
+    B+ Tree implementation used as an ordered map, where every node holds up to order - 1 values
+    searched by binary search, the data is only stored in the leaves and the leaves are linked
+    in order
+
+    Since every node is at least half full, all operations take O(logn) and the height of the
+    tree is O(log_order(n)), so a lookup follows far fewer links than in a Binary Search Tree
+
+    Note: The values of the internal nodes only guide the search, so a value removed from a leaf
+    can still appear in the internal nodes
+
+    Note: Unlike BinarySearchTree.find which returns a Node, find returns the stored value itself since the
+    values do not have nodes of their own. Use get for the data, and set to change it
+    """
+    def __init__(self, order=64):
+        if order < 3:
+            raise ValueError("The order of a B+ Tree must be at least 3")
+
+        self.order = order
+        self.root = LeafNode()
+        self.size = 0
+
+        # Minimum number of values in a leaf and of children in an internal node other than the root
+        self.min_leaf_values = order // 2
+        self.min_children = (order + 1) // 2
+
+    @classmethod
+    def from_sorted(cls, values, data=None, order=64):
+        """
+        Bulk load a B+ Tree from the given strictly increasing values, with the data of each value
+        taken from the optional data iterable
+        - Time Complexity: O(n) where n = number of values
+        - Space Complexity: O(n) where n = number of values
+
+        Note: The nodes of each level are filled as evenly as possible from left to right, which
+        keeps every node at least half full without any splits
+        """
+        tree = cls(order)
+        values = list(values)
+        data = list(data) if data != None else [None] * len(values)
+        if len(data) != len(values):
+            raise ValueError("The given data does not match the given values")
+        for i in range(1, len(values)):
+            if not values[i - 1] < values[i]:
+                raise ValueError("The given values are not strictly increasing")
+        if not values:
+            return tree
+
+        def _split_evenly(count, capacity):
+            parts = -(-count // capacity)
+            return [(count * i // parts, count * (i + 1) // parts) for i in range(parts)]
+
+        # Build the linked leaves, remembering the smallest value under every node for the separators
+        nodes = []
+        lows = []
+        for start, end in _split_evenly(len(values), order - 1):
+            leaf = LeafNode(values[start:end], data[start:end])
+            if nodes:
+                nodes[-1].next = leaf
+            nodes.append(leaf)
+            lows.append(values[start])
+
+        # Build the internal levels until a single root is left
+        while len(nodes) > 1:
+            parents = []
+            parent_lows = []
+            for start, end in _split_evenly(len(nodes), order):
+                parents.append(InternalNode(lows[start + 1:end], nodes[start:end]))
+                parent_lows.append(lows[start])
+            nodes = parents
+            lows = parent_lows
+
+        tree.root = nodes[0]
+        tree.size = len(values)
+        return tree
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        leaf = self.find_leaf(value)
+        index = bisect_left(leaf.values, value)
+        return index < len(leaf.values) and leaf.values[index] == value
+
+    def __iter__(self):
+        """
+        Lazily yield the values in the B+ Tree by their order
+        - Time Complexity: O(n) where n = number of values
+        - Space Complexity: O(1)
+        """
+        for value, _ in self.range():
+            yield value
+
+    def find_leaf(self, value):
+        """
+        Find the leaf which holds the given value if it exists in the B+ Tree
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[bisect_right(node.values, value)]
+        return node
+
+    def find(self, value):
+        """
+        Find the given value in the B+ Tree, returning the value or None if it does not exist
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        leaf = self.find_leaf(value)
+        index = bisect_left(leaf.values, value)
+        if index < len(leaf.values) and leaf.values[index] == value:
+            return leaf.values[index]
+        return None
+
+    def get(self, value, default=None):
+        """
+        Returns the data stored with the given value, or the default if the value does not exist
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        leaf = self.find_leaf(value)
+        index = bisect_left(leaf.values, value)
+        if index < len(leaf.values) and leaf.values[index] == value:
+            return leaf.data[index]
+        return default
+
+    def set(self, value, data):
+        """
+        Store the given data with the given value, inserting the value if it does not exist
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        self.put(value, data, True)
+
+    def insert(self, value, data=None):
+        """
+        Insert the given value with the given data to the B+ Tree
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        self.put(value, data, False)
+
+    def put(self, value, data, replace):
+        """
+        Insert the given value into its leaf and split the full nodes on the path bottom-up,
+        replacing the data of an existing value if allowed
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(log_order(n)) where n = number of values
+        """
+        path = []
+        node = self.root
+        while isinstance(node, InternalNode):
+            index = bisect_right(node.values, value)
+            path.append((node, index))
+            node = node.children[index]
+
+        index = bisect_left(node.values, value)
+        if index < len(node.values) and node.values[index] == value:
+            if not replace:
+                raise ValueError("The given value already exists in the B+ Tree")
+            node.data[index] = data
+            return
+
+        node.values.insert(index, value)
+        node.data.insert(index, data)
+        self.size += 1
+        if len(node.values) < self.order:
+            return
+
+        # Split the full leaf in half, copying the first value of the new leaf up as the separator
+        middle = len(node.values) // 2
+        new_node = LeafNode(node.values[middle:], node.data[middle:], node.next)
+        del node.values[middle:]
+        del node.data[middle:]
+        node.next = new_node
+        separator = new_node.values[0]
+
+        # Insert the separators into the parents, splitting every full parent and moving its middle value up
+        while path:
+            parent, index = path.pop()
+            parent.values.insert(index, separator)
+            parent.children.insert(index + 1, new_node)
+            if len(parent.values) < self.order:
+                return
+
+            middle = len(parent.values) // 2
+            separator = parent.values[middle]
+            new_node = InternalNode(parent.values[middle + 1:], parent.children[middle + 1:])
+            del parent.values[middle:]
+            del parent.children[middle + 1:]
+
+        self.root = InternalNode([separator], [self.root, new_node])
+
+    def delete(self, value):
+        """
+        Remove the given value and return the data stored with it
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(log_order(n)) where n = number of values
+        """
+        path = []
+        node = self.root
+        while isinstance(node, InternalNode):
+            index = bisect_right(node.values, value)
+            path.append((node, index))
+            node = node.children[index]
+
+        index = bisect_left(node.values, value)
+        if index == len(node.values) or node.values[index] != value:
+            raise ValueError("The given value does not exist in the B+ Tree")
+
+        del node.values[index]
+        data = node.data.pop(index)
+        self.size -= 1
+
+        # Refill the nodes which became less than half full bottom-up, by borrowing from or merging with a sibling
+        while path and self.is_underfull(node):
+            parent, index = path.pop()
+            if index > 0:
+                separator_index = index - 1
+                left, right = parent.children[index - 1], node
+                sibling = left
+            else:
+                separator_index = index
+                left, right = node, parent.children[index + 1]
+                sibling = right
+
+            if not self.is_underfull(sibling, 1):
+                self.borrow(parent, separator_index, left, right, sibling is left)
+                break
+
+            self.merge(parent, separator_index, left, right)
+            node = parent
+
+        # Shrink the tree when the root is left with a single child
+        if isinstance(self.root, InternalNode) and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+
+        return data
+
+    def remove(self, value):
+        """
+        Remove the given value from the B+ Tree if it exists
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(log_order(n)) where n = number of values
+        """
+        if value in self:
+            self.delete(value)
+
+    def is_underfull(self, node, removed=0):
+        """
+        Returns whether the given node would be less than half full after removing the given number of entries
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        if isinstance(node, LeafNode):
+            return len(node.values) - removed < self.min_leaf_values
+        return len(node.children) - removed < self.min_children
+
+    def borrow(self, parent, separator_index, left, right, from_left):
+        """
+        Move one entry between the given adjacent siblings through their separator in the parent
+        - Time Complexity: O(order)
+        - Space Complexity: O(1)
+        """
+        if isinstance(left, LeafNode):
+            if from_left:
+                right.values.insert(0, left.values.pop())
+                right.data.insert(0, left.data.pop())
+            else:
+                left.values.append(right.values.pop(0))
+                left.data.append(right.data.pop(0))
+            parent.values[separator_index] = right.values[0]
+        elif from_left:
+            right.values.insert(0, parent.values[separator_index])
+            right.children.insert(0, left.children.pop())
+            parent.values[separator_index] = left.values.pop()
+        else:
+            left.values.append(parent.values[separator_index])
+            left.children.append(right.children.pop(0))
+            parent.values[separator_index] = right.values.pop(0)
+
+    def merge(self, parent, separator_index, left, right):
+        """
+        Merge the given right sibling into the left sibling and remove their separator from the parent
+        - Time Complexity: O(order)
+        - Space Complexity: O(1)
+        """
+        separator = parent.values.pop(separator_index)
+        del parent.children[separator_index + 1]
+        if isinstance(left, LeafNode):
+            left.values.extend(right.values)
+            left.data.extend(right.data)
+            left.next = right.next
+        else:
+            left.values.append(separator)
+            left.values.extend(right.values)
+            left.children.extend(right.children)
+
+    def range(self, low=None, high=None):
+        """
+        Lazily yield the (value, data) pairs with low <= value < high by their order, where a missing
+        bound is unlimited
+        - Time Complexity: O(logn + k) where n = number of values and k = number of yielded pairs
+        - Space Complexity: O(1)
+        """
+        if low != None:
+            leaf = self.find_leaf(low)
+            index = bisect_left(leaf.values, low)
+        else:
+            leaf = self.root
+            while isinstance(leaf, InternalNode):
+                leaf = leaf.children[0]
+            index = 0
+
+        # Follow the links between the leaves instead of going back up the tree
+        while leaf != None:
+            values = leaf.values
+            while index < len(values):
+                if high != None and values[index] >= high:
+                    return
+                yield values[index], leaf.data[index]
+                index += 1
+            leaf = leaf.next
+            index = 0
+
+    def get_height(self):
+        """
+        Returns the height of the B+ Tree, where a tree with a single leaf has height 0
+        - Time Complexity: O(log_order(n)) where n = number of values
+        - Space Complexity: O(1)
+        """
+        height = 0
+        node = self.root
+        while isinstance(node, InternalNode):
+            node = node.children[0]
+            height += 1
+        return height
+
+# Testing
+if __name__ == "__main__":
+    def check_tree(test, tree):
+        """
+        Check that every leaf is at the same depth, every non-root node is at least half full and
+        the values are ordered both in the tree and along the leaf links
+        """
+        leaves = []
+        stack = [(tree.root, 0, None, None)]
+        while stack:
+            node, depth, low, high = stack.pop()
+            test.assertTrue(all(low == None or low <= value for value in node.values))
+            test.assertTrue(all(high == None or value < high for value in node.values))
+            test.assertEqual(node.values, sorted(node.values))
+            test.assertLess(len(node.values), tree.order)
+            if node is not tree.root:
+                test.assertFalse(tree.is_underfull(node))
+            if isinstance(node, LeafNode):
+                leaves.append((depth, node))
+                continue
+
+            test.assertEqual(len(node.children), len(node.values) + 1)
+            bounds = [low] + node.values + [high]
+            for i in range(len(node.children) - 1, -1, -1):
+                stack.append((node.children[i], depth + 1, bounds[i], bounds[i + 1]))
+
+        test.assertEqual({depth for depth, _ in leaves}, {tree.get_height()})
+        for (_, leaf), (_, next_leaf) in zip(leaves, leaves[1:] + [(None, None)]):
+            test.assertIs(leaf.next, next_leaf)
+
+    class TestBPlusTree(unittest.TestCase):
+        def test_insert_find(self):
+            tree = BPlusTree(4)
+            for value in [10, 5, 12, 3, -1, 70, 11, 4, 8, 9]:
+                tree.insert(value, str(value))
+            check_tree(self, tree)
+            self.assertEqual(len(tree), 10)
+            self.assertEqual(tree.find(12), 12)
+            self.assertEqual(tree.find(13), None)
+            self.assertEqual(tree.get(8), '8')
+            self.assertTrue(11 in tree)
+            self.assertEqual(list(tree), [-1, 3, 4, 5, 8, 9, 10, 11, 12, 70])
+            self.assertRaises(ValueError, tree.insert, 5)
+
+        def test_range(self):
+            tree = BPlusTree(5)
+            for value in range(0, 100, 3):
+                tree.set(value, value * 10)
+            self.assertEqual(list(tree.range(10, 22)), [(12, 120), (15, 150), (18, 180), (21, 210)])
+            self.assertEqual([value for value, _ in tree.range(high=7)], [0, 3, 6])
+            self.assertEqual([value for value, _ in tree.range(97)], [99])
+            self.assertEqual(list(tree.range(100)), [])
+
+        def test_random_operations(self):
+            random.seed(221)
+            for order in [3, 4, 7, 32]:
+                tree = BPlusTree(order)
+                expected = {}
+                for _ in range(3000):
+                    value = random.randrange(500)
+                    if random.random() < 0.55:
+                        tree.set(value, -value)
+                        expected[value] = -value
+                    elif value in expected:
+                        self.assertEqual(tree.delete(value), expected.pop(value))
+                    else:
+                        self.assertRaises(ValueError, tree.delete, value)
+                check_tree(self, tree)
+                self.assertEqual(len(tree), len(expected))
+                self.assertEqual(list(tree.range()), sorted(expected.items()))
+
+                for value in list(expected):
+                    tree.remove(value)
+                self.assertEqual((len(tree), tree.get_height()), (0, 0))
+
+        def test_from_sorted(self):
+            for order in [3, 4, 64]:
+                for count in [0, 1, 2, 3, 10, 1000]:
+                    tree = BPlusTree.from_sorted(range(count), range(0, 2 * count, 2), order)
+                    check_tree(self, tree)
+                    self.assertEqual(list(tree.range()), [(value, 2 * value) for value in range(count)])
+                    tree.insert(count)
+                    tree.remove(0)
+                    check_tree(self, tree)
+            self.assertRaises(ValueError, BPlusTree.from_sorted, [2, 1])
+
+    unittest.main()
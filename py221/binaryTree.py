@@ -1,34 +1,56 @@
 import unittest
+import random
 
 class Node:
     """
     Basic Node implementation for Binary Tree
     """
-    def __init__(self, value, *, left=None, right=None):
+    def __init__(self, value, data=None, *, left=None, right=None):
         self.value = value
+        self.data = data # Data is the payload of the value when the tree is used as a map
         self.left = left
         self.right = right
         self.height = 0 # Height is used in AVL trees for more performant operations
+        self.size = 1 # Size is the number of nodes in the subtree, used in AVL trees for rank and select
         
     def get_height(self):
         """
         Returns the height of the Binary Tree Node
             where the height is the longest path from this node to a leaf node      
-        - Time Complexity: O(2^h or n) where h = height and n = number of nodes 
+        - Time Complexity: O(n) where n = number of nodes
+        - Space Complexity: O(h) where h = height
+
+        Note: Walking the tree with an explicit stack of (node, depth) pairs works for trees of
+        any depth, where recursion would stop at the recursion limit
+        """
+        height = 0
+        stack = [(self, 0)]
+        while stack:
+            node, depth = stack.pop()
+            height = max(height, depth)
+            if node.left != None:
+                stack.append((node.left, depth + 1))
+            if node.right != None:
+                stack.append((node.right, depth + 1))
+
+        return height
+
+    def update(self):
+        """
+        Update the cached height and size of the node from the cached heights and sizes of its children
+        - Time Complexity: O(1)
         - Space Complexity: O(1)
         """
-        def _get_height(node):
-            if node != None:
-                return 1 + max(_get_height(node.left), _get_height(node.right))
-            return -1
-        
-        return _get_height(self)
+        left_height, left_size = (self.left.height, self.left.size) if self.left != None else (-1, 0)
+        right_height, right_size = (self.right.height, self.right.size) if self.right != None else (-1, 0)
+        self.height = 1 + max(left_height, right_height)
+        self.size = 1 + left_size + right_size
 
     def get_balance(self):
         """
         Returns the balance of the Binary Tree Node
             where the balance is the height difference between its right and left child 
-        - Time Complexity: O(2^h or n) where h = height and n = number of nodes 
+        - Time Complexity: O(1) since the heights of the children are cached
         - Space Complexity: O(1)
         """
         right_height = 0
@@ -51,8 +73,8 @@ class Node:
         self.right = right_node.left
         right_node.left = self
 
-        self.height = self.get_height()
-        right_node.height = right_node.get_height()
+        self.update()
+        right_node.update()
         return right_node
 
     def right_rotate(self):
@@ -65,8 +87,8 @@ class Node:
         self.left = left_node.right
         left_node.right = self
 
-        self.height = self.get_height()
-        left_node.height = left_node.get_height()
+        self.update()
+        left_node.update()
         return left_node
 
 class BinaryTree:
@@ -82,91 +104,425 @@ class BinaryTree:
     def get_height(self):
         return self.root.get_height()
     
+    def preorder_traversal(self):
+        """
+        Yield the nodes by traversing current -> left -> right
+        - Time Complexity: O(n) where n = number of nodes
+        - Space Complexity: O(h) where h = height
+        """
+        stack = [self.root] if self.root != None else []
+        while stack:
+            node = stack.pop()
+            yield node
+
+            # Push the right child first so that the left subtree is visited first
+            if node.right != None:
+                stack.append(node.right)
+            if node.left != None:
+                stack.append(node.left)
+
+    def inorder_traversal(self):
+        """
+        Yield the nodes by traversing left -> current -> right
+        - Time Complexity: O(n) where n = number of nodes
+        - Space Complexity: O(h) where h = height
+        """
+        stack = []
+        node = self.root
+        while stack or node != None:
+            # Descend to the left-most node, keeping the ancestors whose turn comes after their left subtree
+            while node != None:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def postorder_traversal(self):
+        """
+        Yield the nodes by traversing left -> right -> current
+        - Time Complexity: O(n) where n = number of nodes
+        - Space Complexity: O(h) where h = height
+        """
+        stack = []
+        node = self.root
+        last_node = None
+        while stack or node != None:
+            while node != None:
+                stack.append(node)
+                node = node.left
+
+            # A node is finished once its right subtree is empty or has just been yielded
+            node = stack[-1]
+            if node.right != None and node.right is not last_node:
+                node = node.right
+            else:
+                stack.pop()
+                yield node
+                last_node = node
+                node = None
+
     def print_preorder_traversal(self):
         """
         Print the nodes by traversing current -> left -> right
-        - Time Complexity: O(2^h or n) where h = height and n = number of nodes 
-        - Space Complexity: O(1)
+        - Time Complexity: O(n) where n = number of nodes
+        - Space Complexity: O(h) where h = height
         """
-        def _print_preorder_traversal(node):
-            if node != None:
-                print(node.value, end=", ")
-                _print_preorder_traversal(node.left)
-                _print_preorder_traversal(node.right)
-        
-        _print_preorder_traversal(self.root)
+        for node in self.preorder_traversal():
+            print(node.value, end=", ")
     
     def print_inorder_traversal(self):
         """
         Print the nodes by traversing left -> current -> right
-        - Time Complexity: O(2^h or n) where h = height and n = number of nodes 
-        - Space Complexity: O(1)
+        - Time Complexity: O(n) where n = number of nodes
+        - Space Complexity: O(h) where h = height
         """
-        def _print_inorder_traversal(node):
-            if node != None:
-                _print_inorder_traversal(node.left)
-                print(node.value, end=", ")
-                _print_inorder_traversal(node.right)
-        
-        _print_inorder_traversal(self.root)
+        for node in self.inorder_traversal():
+            print(node.value, end=", ")
     
     def print_postorder_traversal(self):
         """
         Print the nodes by traversing left -> right -> current
-        - Time Complexity: O(2^h or n) where h = height and n = number of nodes 
-        - Space Complexity: O(1)
+        - Time Complexity: O(n) where n = number of nodes
+        - Space Complexity: O(h) where h = height
         """
-        def _print_postorder_traversal(node):
-            if node != None:
-                _print_postorder_traversal(node.left)
-                _print_postorder_traversal(node.right)
-                print(node.value, end=", ")
-        
-        _print_postorder_traversal(self.root)
+        for node in self.postorder_traversal():
+            print(node.value, end=", ")
 
 class BinarySearchTree(BinaryTree):
     """
     Binary Search Tree implementation with utility functions
 
-    Note: Technically can be used to implement a dictionary if "Key" is added to
-    Node class
+    Note: The tree can be used as a dictionary through get, set and delete, where
+    the values of the nodes are the keys and the data of the nodes are the values
     """
+    node_type = Node
+
+    def __init__(self, root=None):
+        super().__init__(root)
+        self.rotations = 0 # Number of rotations done to balance the tree, used to compare the balanced trees
+
+        # Count the nodes of the given tree
+        self.size = 0
+        stack = [root] if root != None else []
+        while stack:
+            node = stack.pop()
+            self.size += 1
+            stack.extend(child for child in (node.left, node.right) if child != None)
+
+    @classmethod
+    def from_sorted(cls, values, data=None):
+        """
+        Build a perfectly balanced tree from the given strictly increasing values, with the data of
+        each value taken from the optional data iterable
+        - Time Complexity: O(n) where n = number of values
+        - Space Complexity: O(n) where n = number of values
+
+        Note: The middle value of every range becomes the root of its subtree, so the heights of the
+        two subtrees of any node differ by at most one and no rotations are needed
+        """
+        values = list(values)
+        data = list(data) if data != None else [None] * len(values)
+        if len(data) != len(values):
+            raise ValueError("The given data does not match the given values")
+        for i in range(1, len(values)):
+            if not values[i - 1] < values[i]:
+                raise ValueError("The given values are not strictly increasing")
+
+        def _build(low, high):
+            if low > high:
+                return None
+            middle = (low + high) // 2
+            node = cls.node_type(values[middle], data[middle], left=_build(low, middle - 1), right=_build(middle + 1, high))
+            node.update()
+            return node
+
+        return cls(_build(0, len(values) - 1))
+
+    def union(self, other):
+        """
+        Returns a new tree with the values in either tree, keeping the data of this tree for shared values
+        - Time Complexity: O(n + m) where n and m are the numbers of nodes in the trees
+        - Space Complexity: O(n + m) where n and m are the numbers of nodes in the trees
+        """
+        return self.merge(other, True, True, True)
+
+    def intersection(self, other):
+        """
+        Returns a new tree with the values in both trees, keeping the data of this tree
+        - Time Complexity: O(n + m) where n and m are the numbers of nodes in the trees
+        - Space Complexity: O(n + m) where n and m are the numbers of nodes in the trees
+        """
+        return self.merge(other, False, True, False)
+
+    def difference(self, other):
+        """
+        Returns a new tree with the values in this tree which are not in the other tree
+        - Time Complexity: O(n + m) where n and m are the numbers of nodes in the trees
+        - Space Complexity: O(n + m) where n and m are the numbers of nodes in the trees
+        """
+        return self.merge(other, True, False, False)
+
+    def merge(self, other, keep_self, keep_both, keep_other):
+        """
+        Merge the in-order streams of both trees like in merge sort and build a new tree from the values
+        only in this tree, in both trees or only in the other tree, depending on the given flags
+        - Time Complexity: O(n + m) where n and m are the numbers of nodes in the trees
+        - Space Complexity: O(n + m) where n and m are the numbers of nodes in the trees
+        """
+        values = []
+        data = []
+        self_nodes = self.inorder_traversal()
+        other_nodes = other.inorder_traversal()
+        self_node = next(self_nodes, None)
+        other_node = next(other_nodes, None)
+        while self_node != None or other_node != None:
+            if other_node == None or (self_node != None and self_node.value < other_node.value):
+                node, keep = self_node, keep_self
+                self_node = next(self_nodes, None)
+            elif self_node == None or other_node.value < self_node.value:
+                node, keep = other_node, keep_other
+                other_node = next(other_nodes, None)
+            else:
+                node, keep = self_node, keep_both
+                self_node = next(self_nodes, None)
+                other_node = next(other_nodes, None)
+
+            if keep:
+                values.append(node.value)
+                data.append(node.data)
+
+        return type(self).from_sorted(values, data)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.find(value) != None
+
+    def get(self, value, default=None):
+        """
+        Returns the data stored with the given value, or the default if the value does not exist
+        - Time Complexity: O(h) where h = height
+        - Space Complexity: O(1)
+        """
+        node = self.find(value)
+        return node.data if node != None else default
+
+    def set(self, value, data):
+        """
+        Store the given data with the given value, inserting the value if it does not exist
+        - Time Complexity: O(h) where h = height
+        - Space Complexity: O(1)
+        """
+        node = self.find(value)
+        if node != None:
+            node.data = data
+        else:
+            self.insert(value, data)
+
+    def delete(self, value):
+        """
+        Remove the given value and return the data stored with it
+        - Time Complexity: O(h) where h = height
+        - Space Complexity: O(1)
+        """
+        node = self.find(value)
+        if node == None:
+            raise ValueError("The given value does not exist in the Binary Search Tree")
+
+        data = node.data
+        self.remove(value)
+        return data
+
     def find(self, value):
         """
         Find the node with the given value in the Binary Search Tree
         - Time Complexity: O(h) where h = height
         - Space Complexity: O(1)
         """
-        def _find(node):
-            if node != None:
-                if node.value > value:
-                    return _find(node.left)
-                elif node.value < value:
-                    return _find(node.right)
+        node = self.root
+        while node != None:
+            if node.value > value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                return node
+
+        return None
+
+    def __iter__(self):
+        """
+        Lazily yield the values in the Binary Search Tree by their order
+        - Time Complexity: O(n) where n = number of nodes
+        - Space Complexity: O(h) where h = height
+        """
+        for node in self.inorder_traversal():
+            yield node.value
+
+    def range(self, low=None, high=None):
+        """
+        Lazily yield the nodes with low <= value < high by their order, where a missing bound is unlimited
+        - Time Complexity: O(h + k) where h = height and k = number of yielded nodes
+        - Space Complexity: O(h) where h = height
+        """
+        stack = []
+        node = self.root
+        while stack or node != None:
+            # Descend to the left-most node in range, skipping the left subtrees below the lower bound
+            while node != None:
+                if low != None and node.value < low:
+                    node = node.right
                 else:
-                    return node
-        
-        return _find(self.root)
+                    stack.append(node)
+                    node = node.left
 
-    def insert(self, value):
+            if not stack:
+                return
+            node = stack.pop()
+            if high != None and node.value >= high:
+                return
+            yield node
+            node = node.right
+
+    def floor(self, value):
         """
-        Insert a new node with the given value to the Binary Search Tree
+        Find the node with the largest value less than or equal to the given value
         - Time Complexity: O(h) where h = height
         - Space Complexity: O(1)
         """
-        def _insert(node):
-            if node == None:
-                return Node(value)
+        result = None
+        node = self.root
+        while node != None:
+            if node.value > value:
+                node = node.left
+            elif node.value < value:
+                result = node
+                node = node.right
+            else:
+                return node
+
+        return result
+
+    def ceiling(self, value):
+        """
+        Find the node with the smallest value greater than or equal to the given value
+        - Time Complexity: O(h) where h = height
+        - Space Complexity: O(1)
+        """
+        result = None
+        node = self.root
+        while node != None:
+            if node.value < value:
+                node = node.right
+            elif node.value > value:
+                result = node
+                node = node.left
             else:
-                if node.value > value:
-                    node.left = _insert(node.left)
-                elif node.value < value:
-                    node.right = _insert(node.right)
-                else:
-                    raise ValueError("The given value already exists in the Binary Search Tree")
                 return node
 
-        self.root = _insert(self.root)
+        return result
+
+    def predecessor(self, value):
+        """
+        Find the node with the largest value strictly less than the given value
+        - Time Complexity: O(h) where h = height
+        - Space Complexity: O(1)
+        """
+        result = None
+        node = self.root
+        while node != None:
+            if node.value < value:
+                result = node
+                node = node.right
+            else:
+                node = node.left
+
+        return result
+
+    def successor(self, value):
+        """
+        Find the node with the smallest value strictly greater than the given value
+        - Time Complexity: O(h) where h = height
+        - Space Complexity: O(1)
+        """
+        result = None
+        node = self.root
+        while node != None:
+            if node.value > value:
+                result = node
+                node = node.left
+            else:
+                node = node.right
+
+        return result
+
+    def replace_child(self, parent, child, new_child):
+        """
+        Put the new child in the place of the given child of the parent, or in the place of the root
+        when the parent is None
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        if parent == None:
+            self.root = new_child
+        elif parent.left is child:
+            parent.left = new_child
+        else:
+            parent.right = new_child
+
+    def insert(self, value, data=None):
+        """
+        Insert a new node with the given value to the Binary Search Tree
+        - Time Complexity: O(h) where h = height
+        - Space Complexity: O(1)
+        """
+        parent = None
+        node = self.root
+        while node != None:
+            parent = node
+            if node.value > value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                raise ValueError("The given value already exists in the Binary Search Tree")
+
+        new_node = Node(value, data)
+        if parent == None:
+            self.root = new_node
+        elif parent.value > value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self.size += 1
+
+    def take_predecessor(self, node, parent, path=None):
+        """
+        Returns the node which is unlinked to remove the given node, with its parent. A node with two children
+        takes the value of the right-most node of its left subtree, which has no right child and is removed
+        in its place. The nodes passed on the way down are appended to the path if one is given
+        - Time Complexity: O(h) where h = height
+        - Space Complexity: O(1)
+        """
+        if node.left == None or node.right == None:
+            return node, parent
+
+        parent = node
+        child = node.left
+        if path != None:
+            path.append(node)
+        while child.right != None:
+            parent = child
+            child = child.right
+            if path != None:
+                path.append(parent)
+
+        node.value = child.value
+        node.data = child.data
+        return child, parent
 
     def remove(self, value):
         """
@@ -174,34 +530,18 @@ class BinarySearchTree(BinaryTree):
         - Time Complexity: O(h) where h = height
         - Space Complexity: O(1)
         """
-        def getRightMostChild(node):
-            if node.right == None:
-                return node
-            return getRightMostChild(node.right)
-        
-        def _remove(node, value):
-            if node != None:
-                if node.value > value:
-                    node.left = _remove(node.left, value)
-                elif node.value < value:
-                    node.right = _remove(node.right, value)
-                else:
-                    if node.right == None:
-                        left = node.left
-                        del node
-                        return left
-                    elif node.left == None:
-                        right = node.right
-                        del node
-                        return right
-                    else:
-                        new_node = getRightMostChild(node.left)
-                        node.value = new_node.value
-                        node.left = _remove(node.left, new_node.value)
+        parent = None
+        node = self.root
+        while node != None and node.value != value:
+            parent = node
+            node = node.left if node.value > value else node.right
 
-                return node
-                    
-        self.root = _remove(self.root, value)
+        if node == None:
+            return
+
+        node, parent = self.take_predecessor(node, parent)
+        self.replace_child(parent, node, node.left if node.left != None else node.right)
+        self.size -= 1
 
     def print(self):
         """
@@ -226,100 +566,461 @@ class AVLTree(BinarySearchTree):
         - Time Complexity: O(logn) where n = number of nodes
         - Space Complexity: O(1)
         """
-        self.find(value)
+        return super().find(value)
     
-    def insert(self, value):
+    def rank(self, value):
         """
-        Insert a new node with the given value to the AVL Tree and rotate the tree to balance
+        Returns the number of values in the AVL Tree which are smaller than the given value
         - Time Complexity: O(logn) where n = number of nodes
         - Space Complexity: O(1)
         """
-        def _insert(node):
-            if node == None:
-                return Node(value)
+        rank = 0
+        node = self.root
+        while node != None:
+            if node.value < value:
+                rank += 1 + (node.left.size if node.left != None else 0)
+                node = node.right
             else:
-                if node.value > value:
-                    node.left = _insert(node.left)
-                elif node.value < value:
-                    node.right = _insert(node.right)
-                else:
-                    raise ValueError("The given value already exists in the Binary Search Tree")
-                
-                node.height = node.get_height()
-                balance_factor = node.get_balance()
-                if balance_factor > 1 and node.right.get_balance() >= 1:
-                    return node.left_rotate()
-                elif balance_factor < -1 and node.left.get_balance() <= -1:
-                    return node.right_rotate()
-                elif balance_factor > 1 and node.right.get_balance <= - 1:
+                node = node.left
+
+        return rank
+
+    def select(self, index):
+        """
+        Find the node with the index-th smallest value in the AVL Tree, counting from 0
+        - Time Complexity: O(logn) where n = number of nodes
+        - Space Complexity: O(1)
+        """
+        if index < 0 or index >= self.size:
+            raise ValueError("The given index is out of the range of the AVL Tree")
+
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left != None else 0
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node
+
+    def rebalance(self, path):
+        """
+        Walk the given root-to-node path bottom-up, updating the cached heights and sizes and rotating every
+        unbalanced node back into balance
+        - Time Complexity: O(logn) where n = number of nodes
+        - Space Complexity: O(1)
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            node.update()
+            balance_factor = node.get_balance()
+            if balance_factor > 1:
+                if node.right.get_balance() < 0:
                     node.right = node.right.right_rotate()
-                    return node.left_rotate()
-                elif balance_factor < -1 and node.left.get_balance() >= 1:
+                    self.rotations += 1
+                new_node = node.left_rotate()
+            elif balance_factor < -1:
+                if node.left.get_balance() > 0:
                     node.left = node.left.left_rotate()
-                    return node.right_rotate()
-                
-                return node
-        
-        self.root = _insert(self.root)
+                    self.rotations += 1
+                new_node = node.right_rotate()
+            else:
+                continue
+
+            self.rotations += 1
+            self.replace_child(path[i - 1] if i > 0 else None, node, new_node)
+
+    def insert(self, value, data=None):
+        """
+        Insert a new node with the given value to the AVL Tree and rotate the tree to balance
+        - Time Complexity: O(logn) where n = number of nodes
+        - Space Complexity: O(logn) where n = number of nodes
+        """
+        path = []
+        node = self.root
+        while node != None:
+            path.append(node)
+            if node.value > value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                raise ValueError("The given value already exists in the Binary Search Tree")
+
+        new_node = Node(value, data)
+        if not path:
+            self.root = new_node
+        elif path[-1].value > value:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        self.size += 1
+
+        self.rebalance(path)
     
     def remove(self, value):
         """
         Remove the node with the given value to the AVL Tree and rotate the tree to balance
         - Time Complexity: O(logn) where n = number of nodes
+        - Space Complexity: O(logn) where n = number of nodes
+        """
+        path = []
+        node = self.root
+        while node != None and node.value != value:
+            path.append(node)
+            node = node.left if node.value > value else node.right
+
+        if node == None:
+            return
+
+        node, _ = self.take_predecessor(node, None, path)
+        self.replace_child(path[-1] if path else None, node, node.left if node.left != None else node.right)
+        self.size -= 1
+
+        self.rebalance(path)
+
+    def print(self):
+        """
+        Print the nodes in the AVL Tree by their order
+        - Time Complexity: O(n) where n = number of nodes
         - Space Complexity: O(1)
         """
-        def getRightMostChild(node):
-            if node.right == None:
-                return node
-            return getRightMostChild(node.right)
-        
-        def _remove(node, value):
-            if node != None:
-                if node.value > value:
-                    node.left = _remove(node.left, value)
-                elif node.value < value:
-                    node.right = _remove(node.right, value)
+        self.print_inorder_traversal()
+
+class RedBlackNode(Node):
+    """
+    Node implementation for Red-Black Tree, with a color and a link to its parent
+    """
+    def __init__(self, value, data=None, *, left=None, right=None):
+        super().__init__(value, data, left=left, right=right)
+        self.parent = None
+        self.is_red = True
+
+class RedBlackTree(BinarySearchTree):
+    """
+    A self balancing Binary Search Tree where every node is red or black
+    - The root is black and a red node never has a red child
+    - Every path from a node down to a missing child passes through the same number of black nodes
+
+    The longest path is therefore at most twice the shortest one, so all operations take O(logn).
+    Most violations are fixed by recoloring, which needs at most 2 rotations per insert and 3 per
+    remove, fewer than an AVL Tree which keeps a stricter balance
+
+    Note: The fix-ups follow Cormen et al. (CLRS), with missing children treated as black nodes
+    """
+    node_type = RedBlackNode
+
+    @classmethod
+    def from_sorted(cls, values, data=None):
+        """
+        Build a balanced Red-Black Tree from the given strictly increasing values, where only the nodes
+        on the deepest level are red
+        - Time Complexity: O(n) where n = number of values
+        - Space Complexity: O(n) where n = number of values
+        """
+        tree = super().from_sorted(values, data)
+        height = tree.root.height if tree.root != None else 0
+
+        # Every path to a missing child passes through the black nodes above the deepest level
+        stack = [(tree.root, None, 0)] if tree.root != None else []
+        while stack:
+            node, parent, depth = stack.pop()
+            node.parent = parent
+            node.is_red = depth == height and parent != None
+            for child in (node.left, node.right):
+                if child != None:
+                    stack.append((child, node, depth + 1))
+
+        return tree
+
+    def is_red(self, node):
+        return node != None and node.is_red
+
+    def rotate_left(self, node):
+        """
+        Rotate the given node left, updating the parent links
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        right_node = node.right
+        node.right = right_node.left
+        if right_node.left != None:
+            right_node.left.parent = node
+
+        right_node.parent = node.parent
+        self.replace_child(node.parent, node, right_node)
+        right_node.left = node
+        node.parent = right_node
+        self.rotations += 1
+
+    def rotate_right(self, node):
+        """
+        Rotate the given node right, updating the parent links
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        left_node = node.left
+        node.left = left_node.right
+        if left_node.right != None:
+            left_node.right.parent = node
+
+        left_node.parent = node.parent
+        self.replace_child(node.parent, node, left_node)
+        left_node.right = node
+        node.parent = left_node
+        self.rotations += 1
+
+    def insert(self, value, data=None):
+        """
+        Insert a new red node with the given value to the Red-Black Tree, then recolor and rotate
+        upwards until no red node has a red parent
+        - Time Complexity: O(logn) where n = number of nodes
+        - Space Complexity: O(1)
+        """
+        parent = None
+        node = self.root
+        while node != None:
+            parent = node
+            if node.value > value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                raise ValueError("The given value already exists in the Binary Search Tree")
+
+        node = RedBlackNode(value, data)
+        node.parent = parent
+        if parent == None:
+            self.root = node
+        elif parent.value > value:
+            parent.left = node
+        else:
+            parent.right = node
+        self.size += 1
+
+        while self.is_red(node.parent):
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if self.is_red(uncle):
+                    # A red uncle is recolored with the parent, pushing the red up to the grandparent
+                    parent.is_red = uncle.is_red = False
+                    grandparent.is_red = True
+                    node = grandparent
                 else:
-                    if node.right == None:
-                        left = node.left
-                        del node
-                        return left
-                    elif node.left == None:
-                        right = node.right
-                        del node
-                        return right
-                    else:
-                        new_node = getRightMostChild(node.left)
-                        node.value = new_node.value
-                        node.left = _remove(node.left, new_node.value)
-            
-                node.height = node.get_height()
-                balance_factor = node.get_balance()
-                if balance_factor > 1 and node.right.get_balance() >= 0:
-                    return node.left_rotate()
-                elif balance_factor < -1 and node.left.get_balance() <= 0:
-                    return node.right_rotate()
-                elif balance_factor > 1 and node.right.get_balance() < 0:
-                    node.right = node.right.right_rotate()
-                    return node.left_rotate()
-                elif balance_factor < -1 and node.left.get_balance() > 0:
-                    node.left = node.left.left_rotate()
-                    return node.right_rotate()
+                    # A black uncle is fixed by at most two rotations
+                    if node is parent.right:
+                        node = parent
+                        self.rotate_left(node)
+                        parent = node.parent
+                    parent.is_red = False
+                    grandparent.is_red = True
+                    self.rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if self.is_red(uncle):
+                    parent.is_red = uncle.is_red = False
+                    grandparent.is_red = True
+                    node = grandparent
+                else:
+                    if node is parent.left:
+                        node = parent
+                        self.rotate_right(node)
+                        parent = node.parent
+                    parent.is_red = False
+                    grandparent.is_red = True
+                    self.rotate_left(grandparent)
 
-                return node
-                    
-        self.root = _remove(self.root, value)
-        
-        def print(self):
-            """
-            Print the nodes in the AVL Tree by their order
-            - Time Complexity: O(2^h or n) where h = height and n = number of nodes
-            - Space Complexity: O(1)
-            """
-            self.print_inorder_traversal()
+        self.root.is_red = False
 
-        
+    def remove(self, value):
+        """
+        Remove the node with the given value from the Red-Black Tree, then recolor and rotate
+        upwards until every path has the same number of black nodes again
+        - Time Complexity: O(logn) where n = number of nodes
+        - Space Complexity: O(1)
+        """
+        node = self.find(value)
+        if node == None:
+            return
+
+        node, _ = self.take_predecessor(node, node.parent)
+        child = node.left if node.left != None else node.right
+        parent = node.parent
+        self.replace_child(parent, node, child)
+        if child != None:
+            child.parent = parent
+        self.size -= 1
+
+        if node.is_red:
+            return
+        if self.is_red(child):
+            child.is_red = False
+            return
+
+        # The paths through the child miss a black node, which is moved up or taken from the sibling
+        node = child
+        while node is not self.root and not self.is_red(node):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.is_red:
+                    sibling.is_red = False
+                    parent.is_red = True
+                    self.rotate_left(parent)
+                    sibling = parent.right
+                if not self.is_red(sibling.left) and not self.is_red(sibling.right):
+                    sibling.is_red = True
+                    node = parent
+                    parent = node.parent
+                else:
+                    if not self.is_red(sibling.right):
+                        sibling.left.is_red = False
+                        sibling.is_red = True
+                        self.rotate_right(sibling)
+                        sibling = parent.right
+                    sibling.is_red = parent.is_red
+                    parent.is_red = False
+                    sibling.right.is_red = False
+                    self.rotate_left(parent)
+                    node = self.root
+            else:
+                sibling = parent.left
+                if sibling.is_red:
+                    sibling.is_red = False
+                    parent.is_red = True
+                    self.rotate_right(parent)
+                    sibling = parent.left
+                if not self.is_red(sibling.left) and not self.is_red(sibling.right):
+                    sibling.is_red = True
+                    node = parent
+                    parent = node.parent
+                else:
+                    if not self.is_red(sibling.left):
+                        sibling.right.is_red = False
+                        sibling.is_red = True
+                        self.rotate_left(sibling)
+                        sibling = parent.left
+                    sibling.is_red = parent.is_red
+                    parent.is_red = False
+                    sibling.left.is_red = False
+                    self.rotate_right(parent)
+                    node = self.root
+
+        if node != None:
+            node.is_red = False
 
+class TreapNode(Node):
+    """
+    Node implementation for Treap, with a random priority
+    """
+    def __init__(self, value, data=None, *, left=None, right=None, priority=0):
+        super().__init__(value, data, left=left, right=right)
+        self.priority = priority # Priority is drawn by the Treap from its own random number generator
+
+class Treap(BinarySearchTree):
+    """
+    A randomized Binary Search Tree which is also a max heap on the random priorities of its nodes
+
+    The shape of the tree is the same as if the values were inserted in a random order, so all
+    operations take O(logn) in expectation whatever the order of the values, with less than 2
+    rotations per insert or remove on average
+
+    Note: The priorities come from a random number generator of the Treap, seeded with the given seed,
+    so they do not depend on how the values were shuffled with the random module
+    """
+    node_type = TreapNode
+
+    def __init__(self, root=None, seed=None):
+        super().__init__(root)
+        self.random = random.Random(seed)
+
+    @classmethod
+    def from_sorted(cls, values, data=None, seed=None):
+        """
+        Build a balanced Treap from the given strictly increasing values, handing out random priorities
+        level by level so that every parent has a higher priority than its children
+        - Time Complexity: O(nlogn) where n = number of values
+        - Space Complexity: O(n) where n = number of values
+        """
+        tree = super().from_sorted(values, data)
+        tree.random.seed(seed)
+        priorities = sorted((tree.random.random() for _ in range(tree.size)), reverse=True)
+        level = [tree.root] if tree.root != None else []
+        index = 0
+        while level:
+            for node in level:
+                node.priority = priorities[index]
+                index += 1
+            level = [child for node in level for child in (node.left, node.right) if child != None]
+
+        return tree
+
+    def insert(self, value, data=None):
+        """
+        Insert a new node with the given value to the Treap as a leaf, then rotate it up while its
+        priority is higher than the priority of its parent
+        - Time Complexity: O(logn) in expectation where n = number of nodes
+        - Space Complexity: O(logn) in expectation where n = number of nodes
+        """
+        path = []
+        node = self.root
+        while node != None:
+            path.append(node)
+            if node.value > value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                raise ValueError("The given value already exists in the Binary Search Tree")
+
+        node = TreapNode(value, data, priority=self.random.random())
+        if not path:
+            self.root = node
+        elif path[-1].value > value:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        self.size += 1
+
+        while path and path[-1].priority < node.priority:
+            parent = path.pop()
+            if parent.left is node:
+                parent.right_rotate()
+            else:
+                parent.left_rotate()
+            self.replace_child(path[-1] if path else None, parent, node)
+            self.rotations += 1
+
+    def remove(self, value):
+        """
+        Remove the node with the given value from the Treap by rotating it down below its child with
+        the higher priority until it has at most one child
+        - Time Complexity: O(logn) in expectation where n = number of nodes
+        - Space Complexity: O(1)
+        """
+        parent = None
+        node = self.root
+        while node != None and node.value != value:
+            parent = node
+            node = node.left if node.value > value else node.right
+
+        if node == None:
+            return
+
+        while node.left != None and node.right != None:
+            if node.left.priority > node.right.priority:
+                new_parent = node.right_rotate()
+            else:
+                new_parent = node.left_rotate()
+            self.replace_child(parent, node, new_parent)
+            parent = new_parent
+            self.rotations += 1
+
+        self.replace_child(parent, node, node.left if node.left != None else node.right)
+        self.size -= 1
 
 if __name__ == "__main__":
     def get_test_binary_tree():
@@ -428,5 +1129,159 @@ if __name__ == "__main__":
             self.assertEqual(tree.root.get_balance(), 0)
             self.assertEqual(tree.root.value, 5)
 
+        def test_traversals(self):
+            tree = get_test_binary_tree()
+            self.assertEqual([node.value for node in tree.preorder_traversal()], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+            self.assertEqual([node.value for node in tree.inorder_traversal()], [2, 1, 3, 4, 0, 6, 5, 8, 7, 11, 10, 9])
+            self.assertEqual([node.value for node in tree.postorder_traversal()], [2, 4, 3, 1, 6, 8, 11, 10, 9, 7, 5, 0])
+
+        def test_bst_deep_tree(self):
+            # Sorted inserts degrade the tree into a linked list deeper than the recursion limit
+            tree = BinarySearchTree()
+            for value in range(5000):
+                tree.insert(value)
+            self.assertEqual(tree.get_height(), 4999)
+            self.assertEqual(tree.find(4999).value, 4999)
+            self.assertEqual(len(list(tree.postorder_traversal())), 5000)
+            for value in range(0, 5000, 2):
+                tree.remove(value)
+            self.assertEqual([node.value for node in tree.inorder_traversal()], list(range(1, 5000, 2)))
+            self.assertEqual(len(tree), 2500)
+
+        def test_ordered_queries(self):
+            tree = get_test_binary_search_tree()
+            self.assertEqual(list(tree), [-1, 3, 4, 5, 10, 11, 12, 70])
+            self.assertEqual([node.value for node in tree.range(4, 12)], [4, 5, 10, 11])
+            self.assertEqual([node.value for node in tree.range(high=4)], [-1, 3])
+            self.assertEqual([node.value for node in tree.range(13)], [70])
+            self.assertEqual((tree.floor(9).value, tree.ceiling(9).value), (5, 10))
+            self.assertEqual((tree.floor(10).value, tree.ceiling(10).value), (10, 10))
+            self.assertEqual((tree.predecessor(10).value, tree.successor(10).value), (5, 11))
+            self.assertEqual((tree.floor(-2), tree.successor(70)), (None, None))
+
+        def test_avl_rank_select(self):
+            tree = AVLTree()
+            for value in range(0, 200, 2):
+                tree.insert(value)
+            for value in range(0, 200, 4):
+                tree.remove(value)
+            self.assertEqual(tree.root.size, 50)
+            self.assertEqual([tree.select(i).value for i in range(5)], [2, 6, 10, 14, 18])
+            self.assertEqual((tree.rank(2), tree.rank(10), tree.rank(11), tree.rank(1000)), (0, 2, 3, 50))
+            self.assertEqual(tree.select(tree.rank(98)).value, 98)
+            self.assertRaises(ValueError, tree.select, 50)
+
+        def test_avl_from_sorted(self):
+            tree = AVLTree.from_sorted(range(1000))
+            self.assertEqual(len(tree), 1000)
+            self.assertEqual(tree.root.height, tree.get_height())
+            self.assertEqual(tree.root.height, 9)
+            self.assertEqual(tree.select(500).value, 500)
+            tree.insert(1000)
+            tree.remove(0)
+            self.assertEqual(list(tree), list(range(1, 1001)))
+            self.assertRaises(ValueError, AVLTree.from_sorted, [1, 3, 3])
+            self.assertEqual(len(AVLTree.from_sorted([])), 0)
+
+        def test_set_operations(self):
+            tree = AVLTree.from_sorted([1, 3, 5, 7, 9], 'abcde')
+            other = AVLTree.from_sorted([3, 4, 5, 10], 'wxyz')
+            union = tree.union(other)
+            self.assertEqual(list(union), [1, 3, 4, 5, 7, 9, 10])
+            self.assertEqual((union.get(3), union.get(4)), ('b', 'x'))
+            self.assertEqual(list(tree.intersection(other)), [3, 5])
+            self.assertEqual(list(tree.difference(other)), [1, 7, 9])
+            self.assertEqual(list(other.difference(tree)), [4, 10])
+            self.assertTrue(isinstance(union, AVLTree))
+
+        def test_red_black_tree(self):
+            def check_red_black(node, parent=None):
+                # Returns the number of black nodes on every path from the node down to a missing child
+                if node == None:
+                    return 1
+                self.assertIs(node.parent, parent)
+                if node.is_red:
+                    self.assertFalse(parent == None or parent.is_red)
+                left_height = check_red_black(node.left, node)
+                self.assertEqual(left_height, check_red_black(node.right, node))
+                return left_height + (0 if node.is_red else 1)
+
+            random.seed(221)
+            tree = RedBlackTree()
+            values = random.sample(range(1000), 500)
+            for value in values:
+                tree.insert(value)
+            check_red_black(tree.root)
+            self.assertLessEqual(tree.rotations, len(values))
+            for value in values[::2]:
+                tree.remove(value)
+            check_red_black(tree.root)
+            self.assertEqual(list(tree), sorted(values[1::2]))
+            self.assertLessEqual(tree.get_height(), 2 * 8)
+
+            tree = RedBlackTree.from_sorted(range(100))
+            check_red_black(tree.root)
+            tree.insert(100)
+            tree.remove(0)
+            check_red_black(tree.root)
+            self.assertEqual(list(tree.union(RedBlackTree.from_sorted([200]))), list(range(1, 101)) + [200])
+
+        def test_treap(self):
+            def check_treap(node):
+                for child in (node.left, node.right) if node != None else ():
+                    if child != None:
+                        self.assertLess(child.priority, node.priority)
+                        check_treap(child)
+
+            tree = Treap(seed=221)
+            for value in range(2000):
+                tree.set(value, -value)
+            check_treap(tree.root)
+            self.assertLess(tree.get_height(), 50)
+            self.assertLess(tree.rotations, 2 * len(tree))
+            for value in range(0, 2000, 2):
+                tree.remove(value)
+            check_treap(tree.root)
+            self.assertEqual(list(tree), list(range(1, 2000, 2)))
+            self.assertEqual(tree.get(7), -7)
+
+            tree = Treap.from_sorted(range(100))
+            check_treap(tree.root)
+            tree.remove(50)
+            self.assertEqual(len(tree), 99)
+
+        def test_avl_find(self):
+            tree = get_test_avl_tree()
+            self.assertEqual(tree.find(12).value, 12)
+            self.assertEqual(tree.find(13), None)
+
+        def test_avl_sorted_insert_heights(self):
+            # Sorted inserts keep the tree logarithmic and the cached heights correct
+            tree = AVLTree()
+            for value in range(1023):
+                tree.insert(value)
+            self.assertEqual(tree.root.height, 9)
+            self.assertEqual(tree.root.height, tree.get_height())
+            for value in range(0, 1023, 2):
+                tree.remove(value)
+            self.assertEqual(tree.root.height, tree.get_height())
+            self.assertEqual(len(tree), 511)
+
+        def test_avl_map(self):
+            tree = AVLTree()
+            tree.set('b', 2)
+            tree.set('a', 1)
+            tree.set('c', 3)
+            tree.set('a', 10)
+            self.assertEqual(len(tree), 3)
+            self.assertEqual(tree.get('a'), 10)
+            self.assertEqual(tree.get('z', 0), 0)
+            self.assertTrue('c' in tree)
+            self.assertEqual(tree.delete('b'), 2)
+            self.assertFalse('b' in tree)
+            self.assertEqual((tree.get('a'), tree.get('c')), (10, 3))
+            self.assertEqual(len(tree), 2)
+            self.assertRaises(ValueError, tree.delete, 'b')
+
     unittest.main()
         
\ No newline at end of file
@@ -0,0 +1,574 @@
+import unittest
+import mmap
+import os
+import random
+import struct
+import tempfile
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+class Page:
+    """
+    In-memory copy of a B+ Tree node stored in a fixed-size page of the file, where leaves hold
+    the data of their values and a link to the next leaf, and internal nodes hold their children
+    """
+    def __init__(self, page_id, is_leaf, values=None, items=None, next=-1):
+        self.page_id = page_id
+        self.is_leaf = is_leaf
+        self.values = values if values != None else []
+        self.items = items if items != None else [] # Data of a leaf or page ids of the children of an internal node
+        self.next = next
+        self.dirty = False
+
+class DiskBPlusTree:
+    """
+    B+ Tree implementation stored in a file of fixed-size pages, used as an ordered map from
+    64-bit integer values to 64-bit integer data
+
+    Only the most recently used pages are kept in memory in a buffer pool, and pages which are not
+    in the pool are read from a memory map of the file. Changed pages stay in the pool until the next
+    checkpoint writes them back, while every change is appended to a log file beside the tree so the
+    changes since the last checkpoint can be replayed after a crash
+
+    Note: Removing a value never merges the leaves, so the pages of deleted values are only
+    reclaimed when the tree is rebuilt
+
+    Note: Unlike BinarySearchTree.find which returns a Node, find returns the stored value itself since the
+    values only exist inside pages. Use get for the data, and set to change it
+    """
+    # Page 0 holds the file header followed by the nodes in pages 1, 2, ...
+    MAGIC = b'BPTD'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHxxIqqq') # magic, version, page size, root page, page count, size
+    NODE_HEADER = struct.Struct('<B3xIq') # is leaf, number of values, next leaf page
+
+    # Records of the log file: operations, page images of a checkpoint and the end of a checkpoint
+    LOG_OPERATION = struct.Struct('<cBqq') # b'O', operation, value, data
+    LOG_PAGE = struct.Struct('<cq') # b'P', page id, followed by the page
+    LOG_COMMIT = b'C'
+    SET = 1
+    DELETE = 2
+
+    def __init__(self, path, page_size=4096, cache_pages=256, sync=False):
+        self.path = path
+        self.cache_pages = cache_pages
+        self.sync = sync
+        self.pages = OrderedDict()
+
+        # Create an empty tree made of a single leaf if the file does not exist
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            if page_size < 64 or page_size % 8 != 0:
+                raise ValueError("The page size must be a multiple of 8 which is at least 64")
+            with open(path, 'wb') as file:
+                header = bytearray(page_size)
+                self.HEADER.pack_into(header, 0, self.MAGIC, self.VERSION, page_size, 1, 2, 0)
+                file.write(header)
+                file.write(self.encode_page(Page(1, True), page_size))
+                file.flush()
+                os.fsync(file.fileno())
+
+        self.file = open(path, 'r+b')
+        self.map = None
+        self.read_header()
+
+        self.log = open(path + '.log', 'a+b')
+        self.replaying = False
+        self.recover()
+
+    def read_header(self):
+        """
+        Map the file into memory and read the root page, page count and size from its header
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        if self.map != None:
+            self.map.close()
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, page_size, root, page_count, size = self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("The given file is not a B+ Tree file")
+
+        self.page_size = page_size
+        self.root = root
+        self.page_count = page_count
+        self.size = size
+
+        # Number of values which fit in a page besides the node header and the data or children
+        self.leaf_capacity = (page_size - self.NODE_HEADER.size) // 16
+        self.internal_capacity = (page_size - self.NODE_HEADER.size - 8) // 16
+
+    def encode_page(self, page, page_size=None):
+        """
+        Returns the bytes of the given page, packed as the node header, the values and then the
+        data or the children
+        - Time Complexity: O(p) where p = page size
+        - Space Complexity: O(p) where p = page size
+        """
+        buffer = bytearray(page_size if page_size != None else self.page_size)
+        count = len(page.values)
+        self.NODE_HEADER.pack_into(buffer, 0, page.is_leaf, count, page.next)
+        struct.pack_into('<%dq' % count, buffer, self.NODE_HEADER.size, *page.values)
+        struct.pack_into('<%dq' % len(page.items), buffer, self.NODE_HEADER.size + 8 * count, *page.items)
+        return buffer
+
+    def decode_page(self, page_id, buffer, offset=0):
+        """
+        Returns the page stored in the given buffer at the given offset
+        - Time Complexity: O(p) where p = page size
+        - Space Complexity: O(p) where p = page size
+        """
+        is_leaf, count, next = self.NODE_HEADER.unpack_from(buffer, offset)
+        offset += self.NODE_HEADER.size
+        values = list(struct.unpack_from('<%dq' % count, buffer, offset))
+        item_count = count if is_leaf else count + 1
+        items = list(struct.unpack_from('<%dq' % item_count, buffer, offset + 8 * count))
+        return Page(page_id, bool(is_leaf), values, items, next)
+
+    def get_page(self, page_id):
+        """
+        Returns the page with the given id from the buffer pool, reading it from the memory map on a miss
+        and evicting the least recently used clean pages while the pool is over its capacity
+        - Time Complexity: O(p) where p = page size
+        - Space Complexity: O(p) where p = page size
+        """
+        page = self.pages.get(page_id)
+        if page != None:
+            self.pages.move_to_end(page_id)
+            return page
+
+        page = self.decode_page(page_id, self.map, page_id * self.page_size)
+        self.pages[page_id] = page
+        self.evict()
+        return page
+
+    def evict(self):
+        """
+        Drop the least recently used clean pages until the pool fits its capacity, keeping every dirty
+        page until the next checkpoint writes it back
+        - Time Complexity: O(c) where c = number of cached pages
+        - Space Complexity: O(1)
+        """
+        if len(self.pages) <= self.cache_pages:
+            return
+
+        for page_id in list(self.pages):
+            if len(self.pages) <= self.cache_pages:
+                break
+            if not self.pages[page_id].dirty:
+                del self.pages[page_id]
+
+    def mark_dirty(self, page):
+        """
+        Mark the given page as changed, putting it back in the pool if it was evicted while in use
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        page.dirty = True
+        self.pages[page.page_id] = page
+        self.pages.move_to_end(page.page_id)
+
+    def allocate_page(self, is_leaf):
+        """
+        Returns a new dirty page at the end of the file
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        page = Page(self.page_count, is_leaf)
+        self.page_count += 1
+        self.mark_dirty(page)
+        return page
+
+    def write_log(self, operation, value, data):
+        """
+        Append the given operation to the log before it changes any page
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        if self.replaying:
+            return
+
+        self.log.write(self.LOG_OPERATION.pack(b'O', operation, value, data))
+        self.log.flush()
+        if self.sync:
+            os.fsync(self.log.fileno())
+
+    def finish_operation(self):
+        """
+        Run a checkpoint after an operation if the dirty pages alone overflow the buffer pool
+
+        Note: While the log is replayed the checkpoint waits until the end, since it empties the log
+        - Time Complexity: O(c * p) where c = number of cached pages and p = page size
+        - Space Complexity: O(p) where p = page size
+        """
+        if len(self.pages) > self.cache_pages and not self.replaying:
+            self.checkpoint()
+            self.evict()
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.find(value) != None
+
+    def __iter__(self):
+        for value, _ in self.range():
+            yield value
+
+    def find_leaf(self, value):
+        """
+        Find the leaf which holds the given value if it exists in the B+ Tree
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        page = self.get_page(self.root)
+        while not page.is_leaf:
+            page = self.get_page(page.items[bisect_right(page.values, value)])
+        return page
+
+    def find(self, value):
+        """
+        Find the given value in the B+ Tree, returning the value or None if it does not exist
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        page = self.find_leaf(value)
+        index = bisect_left(page.values, value)
+        if index < len(page.values) and page.values[index] == value:
+            return value
+        return None
+
+    def get(self, value, default=None):
+        """
+        Returns the data stored with the given value, or the default if the value does not exist
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        page = self.find_leaf(value)
+        index = bisect_left(page.values, value)
+        if index < len(page.values) and page.values[index] == value:
+            return page.items[index]
+        return default
+
+    def set(self, value, data):
+        """
+        Store the given data with the given value, inserting the value if it does not exist
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        self.put(value, data, True)
+
+    def insert(self, value, data=0):
+        """
+        Insert the given value with the given data to the B+ Tree
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        self.put(value, data, False)
+
+    def put(self, value, data, replace):
+        """
+        Insert the given value into its leaf and split the full pages on the path bottom-up,
+        replacing the data of an existing value if allowed
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(logn) where n = number of values
+        """
+        path = []
+        page = self.get_page(self.root)
+        while not page.is_leaf:
+            index = bisect_right(page.values, value)
+            path.append((page, index))
+            page = self.get_page(page.items[index])
+
+        index = bisect_left(page.values, value)
+        exists = index < len(page.values) and page.values[index] == value
+        if exists and not replace:
+            raise ValueError("The given value already exists in the B+ Tree")
+
+        self.write_log(self.SET, value, data)
+        self.mark_dirty(page)
+        if exists:
+            page.items[index] = data
+            self.finish_operation()
+            return
+
+        page.values.insert(index, value)
+        page.items.insert(index, data)
+        self.size += 1
+
+        # Split the full leaf in half, copying the first value of the new leaf up as the separator
+        new_page = None
+        if len(page.values) > self.leaf_capacity:
+            middle = len(page.values) // 2
+            new_page = self.allocate_page(True)
+            new_page.values = page.values[middle:]
+            new_page.items = page.items[middle:]
+            new_page.next = page.next
+            del page.values[middle:]
+            del page.items[middle:]
+            page.next = new_page.page_id
+            separator = new_page.values[0]
+
+        # Insert the separators into the parents, splitting every full parent and moving its middle value up
+        while new_page != None and path:
+            parent, index = path.pop()
+            self.mark_dirty(parent)
+            parent.values.insert(index, separator)
+            parent.items.insert(index + 1, new_page.page_id)
+            new_page = None
+            if len(parent.values) > self.internal_capacity:
+                middle = len(parent.values) // 2
+                separator = parent.values[middle]
+                new_page = self.allocate_page(False)
+                new_page.values = parent.values[middle + 1:]
+                new_page.items = parent.items[middle + 1:]
+                del parent.values[middle:]
+                del parent.items[middle + 1:]
+
+        if new_page != None:
+            root = self.allocate_page(False)
+            root.values = [separator]
+            root.items = [self.root, new_page.page_id]
+            self.root = root.page_id
+
+        self.finish_operation()
+
+    def delete(self, value):
+        """
+        Remove the given value from its leaf and return the data stored with it
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        page = self.find_leaf(value)
+        index = bisect_left(page.values, value)
+        if index == len(page.values) or page.values[index] != value:
+            raise ValueError("The given value does not exist in the B+ Tree")
+
+        self.write_log(self.DELETE, value, 0)
+        self.mark_dirty(page)
+        del page.values[index]
+        data = page.items.pop(index)
+        self.size -= 1
+
+        self.finish_operation()
+        return data
+
+    def remove(self, value):
+        """
+        Remove the given value from the B+ Tree if it exists
+        - Time Complexity: O(logn) where n = number of values
+        - Space Complexity: O(1)
+        """
+        if value in self:
+            self.delete(value)
+
+    def range(self, low=None, high=None):
+        """
+        Lazily yield the (value, data) pairs with low <= value < high by their order, where a missing
+        bound is unlimited
+        - Time Complexity: O(logn + k) where n = number of values and k = number of yielded pairs
+        - Space Complexity: O(1)
+        """
+        if low != None:
+            page = self.find_leaf(low)
+            index = bisect_left(page.values, low)
+        else:
+            page = self.get_page(self.root)
+            while not page.is_leaf:
+                page = self.get_page(page.items[0])
+            index = 0
+
+        while True:
+            # Copy the entries of the leaf since the caller may change the tree between the pairs
+            values, items, next = page.values[index:], page.items[index:], page.next
+            for value, data in zip(values, items):
+                if high != None and value >= high:
+                    return
+                yield value, data
+            if next == -1:
+                return
+            page = self.get_page(next)
+            index = 0
+
+    def checkpoint(self):
+        """
+        Write the dirty pages and the header back to the file and empty the log
+
+        The new pages are first appended to the log with a commit record, so a crash while the
+        pages are being written in place is repaired by writing them again from the log
+        - Time Complexity: O(c * p) where c = number of cached pages and p = page size
+        - Space Complexity: O(c * p) where c = number of cached pages and p = page size
+        """
+        images = {page.page_id : self.encode_page(page) for page in self.pages.values() if page.dirty}
+        header = bytearray(self.page_size)
+        self.HEADER.pack_into(header, 0, self.MAGIC, self.VERSION, self.page_size, self.root, self.page_count, self.size)
+        images[0] = header
+
+        for page_id, image in images.items():
+            self.log.write(self.LOG_PAGE.pack(b'P', page_id))
+            self.log.write(image)
+        self.log.write(self.LOG_COMMIT)
+        self.log.flush()
+        os.fsync(self.log.fileno())
+
+        self.write_pages(images)
+        for page in self.pages.values():
+            page.dirty = False
+
+    def write_pages(self, images):
+        """
+        Write the given page images in place, then empty the log and remap the grown file
+        - Time Complexity: O(k * p) where k = number of pages and p = page size
+        - Space Complexity: O(1)
+        """
+        for page_id, image in images.items():
+            os.pwrite(self.file.fileno(), image, page_id * self.page_size)
+        os.fsync(self.file.fileno())
+
+        self.log.truncate(0)
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.read_header()
+
+    def recover(self):
+        """
+        Finish the checkpoint interrupted by a crash if its commit record reached the log, or
+        replay the operations logged since the last checkpoint otherwise
+        - Time Complexity: O(l + k * logn) where l = log size, k = number of logged operations and n = number of values
+        - Space Complexity: O(l) where l = log size
+        """
+        self.log.seek(0)
+        log = self.log.read()
+        operations = []
+        images = {}
+        position = 0
+        while position < len(log):
+            tag = log[position:position + 1]
+            if tag == b'O' and position + self.LOG_OPERATION.size <= len(log):
+                operations.append(self.LOG_OPERATION.unpack_from(log, position)[1:])
+                position += self.LOG_OPERATION.size
+            elif tag == b'P' and position + self.LOG_PAGE.size + self.page_size <= len(log):
+                page_id = self.LOG_PAGE.unpack_from(log, position)[1]
+                position += self.LOG_PAGE.size
+                images[page_id] = log[position:position + self.page_size]
+                position += self.page_size
+            elif tag == self.LOG_COMMIT:
+                # The page images already hold the logged operations
+                self.write_pages(images)
+                return
+            else:
+                # A record cut short by a crash was never acknowledged
+                break
+
+        if not operations:
+            self.log.truncate(0)
+            return
+
+        self.replaying = True
+        for operation, value, data in operations:
+            if operation == self.SET:
+                self.set(value, data)
+            else:
+                self.remove(value)
+        self.replaying = False
+        self.checkpoint()
+
+    def close(self):
+        """
+        Write the changes back to the file with a checkpoint and close the files
+        - Time Complexity: O(c * p) where c = number of cached pages and p = page size
+        - Space Complexity: O(c * p) where c = number of cached pages and p = page size
+        """
+        if self.file == None:
+            return
+
+        self.checkpoint()
+        self.map.close()
+        self.log.close()
+        self.file.close()
+        self.map = self.log = self.file = None
+        self.pages.clear()
+
+# Testing
+if __name__ == "__main__":
+    def crash(tree):
+        """
+        Close the files of the tree without a checkpoint, losing the pages in the buffer pool
+        """
+        tree.map.close()
+        tree.log.close()
+        tree.file.close()
+
+    class TestDiskBPlusTree(unittest.TestCase):
+        def setUp(self):
+            self.directory = tempfile.TemporaryDirectory()
+            self.path = os.path.join(self.directory.name, 'tree.db')
+
+        def tearDown(self):
+            self.directory.cleanup()
+
+        def test_insert_find_remove(self):
+            tree = DiskBPlusTree(self.path, page_size=64, cache_pages=4)
+            random.seed(221)
+            values = random.sample(range(-10000, 10000), 2000)
+            for value in values:
+                tree.insert(value, value * 2)
+            self.assertRaises(ValueError, tree.insert, values[0])
+            for value in values[::2]:
+                tree.remove(value)
+            tree.remove(20000)
+
+            expected = sorted(values[1::2])
+            self.assertEqual(len(tree), 1000)
+            self.assertEqual(list(tree), expected)
+            self.assertEqual(tree.find(values[1]), values[1])
+            self.assertEqual(tree.find(values[0]), None)
+            self.assertEqual(tree.get(values[1]), values[1] * 2)
+            self.assertEqual(list(tree.range(0, 100)), [(value, value * 2) for value in expected if 0 <= value < 100])
+            self.assertLessEqual(len(tree.pages), 2 * tree.cache_pages)
+            tree.close()
+
+            tree = DiskBPlusTree(self.path)
+            self.assertEqual((len(tree), list(tree)), (1000, expected))
+            tree.close()
+
+        def test_recover_from_log(self):
+            tree = DiskBPlusTree(self.path, page_size=128)
+            for value in range(100):
+                tree.set(value, value)
+            tree.checkpoint()
+            for value in range(100, 200):
+                tree.set(value, value)
+            tree.delete(5)
+            tree.set(6, -6)
+            crash(tree)
+
+            tree = DiskBPlusTree(self.path)
+            self.assertEqual(len(tree), 199)
+            self.assertEqual((tree.get(5), tree.get(6), tree.get(150)), (None, -6, 150))
+            self.assertEqual(os.path.getsize(self.path + '.log'), 0)
+            tree.close()
+
+        def test_recover_interrupted_checkpoint(self):
+            tree = DiskBPlusTree(self.path, page_size=128)
+            for value in range(300):
+                tree.set(value, value)
+
+            # Crash after the page images are committed to the log but before they are written in place
+            tree.write_pages = lambda images : None
+            tree.checkpoint()
+            crash(tree)
+
+            tree = DiskBPlusTree(self.path)
+            self.assertEqual(list(tree), list(range(300)))
+            tree.close()
+
+            # A record cut short by a crash is ignored
+            with open(self.path + '.log', 'wb') as log:
+                log.write(DiskBPlusTree.LOG_OPERATION.pack(b'O', DiskBPlusTree.DELETE, 7, 0))
+                log.write(b'O\x01')
+            tree = DiskBPlusTree(self.path)
+            self.assertEqual((len(tree), 7 in tree), (299, False))
+            tree.close()
+
+    unittest.main()
@@ -1,20 +1,37 @@
 import unittest
+import tempfile
+import mmap
+import os
+import pickle
+import struct
 import sys
+import threading
+import time
+from array import array
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, as_completed, FIRST_COMPLETED
 import heap
+import unionFind
 
 class Vertex:
     """
     Simple Vertex Implementation for Graphs
+
+    Note: Slots replace the per-instance dictionary, which shrinks every vertex and edge several times
     """
+    __slots__ = ('value', 'inDegree')
+
     def __init__(self, value):
         self.value = value
-        self.visited = False
         self.inDegree = 0
 
 class Edge:
     """
     Simple Edge Implementation for Graphs
     """
+    __slots__ = ('beginning', 'end', 'weight')
+
     def __init__(self, beginning, end, weight=1):
         self.beginning = beginning
         self.end = end
@@ -26,32 +43,150 @@ class Graph:
     """
     def __init__(self):
         self.al = {}
+        self.listeners = []
 
     def get_vertices(self):
         return list(self.al.keys())
     
     def get_vertex_edges(self, vertex):
         return self.al[vertex]
-    
-    def reset_visited(self):
-        for vertex in self.al.keys():
-            vertex.visited = False
+
+    def get_neighbors(self, vertex):
+        """
+        Returns the (neighbor, weight) pairs of the outgoing edges of the given vertex
+        """
+        return [(edge.end, edge.weight) for edge in self.al[vertex]]
+
+    def get_value(self, vertex):
+        return vertex.value
+
+    def get_edges(self):
+        """
+        Returns the (beginning, end, weight) triples of all edges in the graph
+        """
+        for vertex, edges in self.al.items():
+            for edge in edges:
+                yield edge.beginning, edge.end, edge.weight
     
     def add_vertex(self, vertex):
         if vertex not in self.al:
             self.al[vertex] = []
 
+    def subscribe(self, listener):
+        """
+        Register listener(event, edge) to be called after every edge change, where the event is 'add', 'remove'
+        or 'weight'
+        """
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self.listeners.remove(listener)
+
+    def notify(self, event, edge):
+        for listener in self.listeners:
+            listener(event, edge)
+
+    @classmethod
+    def from_edge_list(cls, edges):
+        """
+        Build a graph from (beginning, end) or (beginning, end, weight) tuples of vertex values, creating one
+        vertex for every distinct value in the order they first appear
+        - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        """
+        graph = cls()
+        vertices = {}
+
+        def get_vertex(value):
+            vertex = vertices.get(value)
+            if vertex == None:
+                vertex = vertices[value] = Vertex(value)
+                graph.al[vertex] = []
+            return vertex
+
+        graph._add_edges((get_vertex(edge[0]), get_vertex(edge[1]), edge[2] if len(edge) > 2 else 1) for edge in edges)
+        return graph
+
+    @classmethod
+    def from_arrays(cls, sources, targets, weights=None, values=None):
+        """
+        Build a graph from parallel arrays of edge endpoint ids and weights, where the vertex with id i gets the
+        value values[i], or i itself if no values are given
+        - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        """
+        if values == None:
+            values = range(max(max(sources, default=-1), max(targets, default=-1)) + 1)
+
+        graph = cls()
+        vertices = [Vertex(value) for value in values]
+        graph.al = {vertex: [] for vertex in vertices}
+
+        if weights == None:
+            graph._add_edges((vertices[beginning], vertices[end], 1) for beginning, end in zip(sources, targets))
+        else:
+            graph._add_edges((vertices[beginning], vertices[end], weight) for beginning, end, weight in zip(sources, targets, weights))
+        return graph
+
+    def transpose(self):
+        """
+        Returns a graph over the same vertices with every edge reversed, an undirected graph is its own transpose
+        - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+
+        Note: The in-degrees of the shared vertices keep counting the edges of the original graph
+        """
+        if isinstance(self, UndirectedGraph):
+            return self
+
+        graph = type(self)()
+        graph.al = {vertex: [] for vertex in self.al}
+        for beginning, end, weight in self.get_edges():
+            graph.al[end].append(Edge(end, beginning, weight))
+        return graph
+
+    def _add_edges(self, edges):
+        # Bulk insertion of (beginning, end, weight) vertex triples whose vertices are known to be in the graph
+        al = self.al
+        undirected = isinstance(self, UndirectedGraph)
+        for beginning, end, weight in edges:
+            edge = Edge(beginning, end, weight)
+            al[beginning].append(edge)
+            end.inDegree += 1
+            if undirected:
+                al[end].append(edge)
+                beginning.inDegree += 1
+
 class UndirectedGraph(Graph):
     """
     Undirected Graph implementation using Adjacency List with utility functions
+
+    Note: Both endpoints share the same Edge object, so the edges of a vertex can start at either endpoint
     """
     def add_edge(self, edge):
         if edge.beginning in self.al and edge.end in self.al:
             self.al[edge.beginning].append(edge)
             edge.beginning.inDegree += 1
 
-            self.al[edge.end].append(Edge(edge.end, edge.beginning, edge.weight))
+            self.al[edge.end].append(edge)
             edge.end.inDegree += 1
+            self.notify('add', edge)
+
+    def get_neighbors(self, vertex):
+        """
+        Returns the (neighbor, weight) pairs of the edges of the given vertex
+        """
+        return [(edge.end if edge.beginning is vertex else edge.beginning, edge.weight) for edge in self.al[vertex]]
+
+    def get_edges(self):
+        """
+        Returns the (beginning, end, weight) triples of all edges in the graph, where each undirected edge is
+        returned once as it was added
+        """
+        for vertex, edges in self.al.items():
+            for edge in edges:
+                if edge.beginning is vertex:
+                    yield edge.beginning, edge.end, edge.weight
 
 class DirectedGraph(Graph):
     """
@@ -61,37 +196,476 @@ class DirectedGraph(Graph):
         if edge.beginning in self.al:
             self.al[edge.beginning].append(edge)
             edge.end.inDegree += 1
+            self.notify('add', edge)
     
     def remove_edge(self, edge):
         if edge.beginning in self.al:
             self.al[edge.beginning].remove(edge)
             edge.end.inDegree -= 1
+            self.notify('remove', edge)
+
+    def set_edge_weight(self, edge, weight):
+        edge.weight = weight
+        self.notify('weight', edge)
+
+class CSRGraph:
+    """
+    Frozen Graph implementation using Compressed Sparse Row arrays
+
+    Vertices are the integer ids 0..n-1 and the outgoing edges of vertex i are stored contiguously in
+    targets[offsets[i]:offsets[i + 1]], with their weights at the same positions of the weights array.
+    Each edge costs two array slots instead of an Edge object inside a list, and a traversal reads
+    neighbouring memory instead of chasing pointers
+
+    Note: Undirected graphs store every edge in both directions like UndirectedGraph does
+    """
+    # Snapshot header: magic, version, flags, vertex count, edge count, weight typecode, values section offset
+    SNAPSHOT_HEADER = struct.Struct('<4sHHqq1s7xq24x')
+    SNAPSHOT_MAGIC = b'CSRG'
+    SNAPSHOT_VERSION = 1
+    SNAPSHOT_DIRECTED = 1
+    SNAPSHOT_VALUES = 2
+    SNAPSHOT_BIG_ENDIAN = 4
+
+    def __init__(self, offsets, targets, weights, values=None, directed=True):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.values = values if values != None else range(len(offsets) - 1)
+        self.directed = directed
+        self.path = None
+        self.buffer = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Build a CSR graph from an adjacency list graph, where the id of each vertex is its position in
+        graph.get_vertices()
+        - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        """
+        vertices = graph.get_vertices()
+        ids = {vertex: index for index, vertex in enumerate(vertices)}
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('q')
+        for vertex in vertices:
+            for end, weight in graph.get_neighbors(vertex):
+                targets.append(ids[end])
+                weights = _append_weight(weights, weight)
+            offsets.append(len(targets))
+
+        values = [graph.get_value(vertex) for vertex in vertices]
+        return cls(offsets, targets, weights, values, not isinstance(graph, UndirectedGraph))
+
+    @classmethod
+    def from_edge_list(cls, edges, directed=True):
+        """
+        Build a CSR graph from (beginning, end) or (beginning, end, weight) tuples of vertex values, where vertex
+        ids are given to the distinct values in the order they first appear
+        - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        """
+        interner = Interner()
+        sources = array('q')
+        targets = array('q')
+        weights = array('q')
+        for edge in edges:
+            sources.append(interner.intern(edge[0]))
+            targets.append(interner.intern(edge[1]))
+            weights = _append_weight(weights, edge[2] if len(edge) > 2 else 1)
+
+        return cls.from_arrays(sources, targets, weights, interner.values, directed)
+
+    @classmethod
+    def from_arrays(cls, sources, targets, weights=None, values=None, directed=True):
+        """
+        Build a CSR graph from parallel arrays of edge endpoint ids and weights by counting sort, keeping the
+        edges of each vertex in their input order
+        - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+
+        Note: Weights are stored as 8 byte integers, or as doubles if any of them is not an integer
+        """
+        vertex_count = len(values) if values != None else max(max(sources, default=-1), max(targets, default=-1)) + 1
+        if weights == None:
+            weights = array('q', [1]) * len(sources)
+        elif isinstance(weights, array):
+            if weights.typecode not in ('q', 'd'):
+                weights = array('d' if weights.typecode in ('f', 'd') else 'q', weights)
+        else:
+            weights = array('d' if any(not isinstance(weight, int) for weight in weights) else 'q', weights)
+
+        # Count the outgoing edges of each vertex, both endpoints own an undirected edge
+        offsets = array('q', bytes(8 * (vertex_count + 1)))
+        for beginning in sources:
+            offsets[beginning + 1] += 1
+        if not directed:
+            for end in targets:
+                offsets[end + 1] += 1
+        for vertex in range(vertex_count):
+            offsets[vertex + 1] += offsets[vertex]
+
+        # Place every edge at the next free slot of its beginning vertex
+        next_slots = offsets[:-1]
+        csr_targets = array('q', bytes(8 * offsets[-1]))
+        csr_weights = array(weights.typecode, bytes(weights.itemsize * offsets[-1]))
+        for beginning, end, weight in zip(sources, targets, weights):
+            csr_targets[next_slots[beginning]] = end
+            csr_weights[next_slots[beginning]] = weight
+            next_slots[beginning] += 1
+            if not directed:
+                csr_targets[next_slots[end]] = beginning
+                csr_weights[next_slots[end]] = weight
+                next_slots[end] += 1
+
+        return cls(offsets, csr_targets, csr_weights, values, directed)
+
+    def transpose(self):
+        """
+        Returns the CSR graph with every edge reversed, an undirected graph is its own transpose
+        - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        """
+        if not self.directed:
+            return self
+
+        sources = array('q', bytes(8 * self.get_edge_count()))
+        for vertex in self.get_vertices():
+            for index in range(self.offsets[vertex], self.offsets[vertex + 1]):
+                sources[index] = vertex
+        return CSRGraph.from_arrays(self.targets, sources, self.weights, self.values)
+
+    def save(self, path):
+        """
+        Write the graph as a binary snapshot: a fixed size header followed by the raw offsets, targets and
+        weights arrays, and the pickled vertex values if they are not the vertex ids themselves
+        - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+        - Space Complexity: O(1) besides the pickled values
+        """
+        flags = self.SNAPSHOT_DIRECTED if self.directed else 0
+        if sys.byteorder == 'big':
+            flags |= self.SNAPSHOT_BIG_ENDIAN
+
+        values = None
+        if self.values != range(self.get_vertex_count()):
+            flags |= self.SNAPSHOT_VALUES
+            values = pickle.dumps(list(self.values), protocol=pickle.HIGHEST_PROTOCOL)
+
+        weight_typecode = self.weights.format if isinstance(self.weights, memoryview) else self.weights.typecode
+        if weight_typecode not in ('q', 'd'):
+            raise ValueError("Only 8 byte integer or double weights can be saved")
+        arrays_size = 8 * (len(self.offsets) + 2 * len(self.targets))
+        values_offset = self.SNAPSHOT_HEADER.size + arrays_size if values != None else 0
+
+        with open(path, 'wb') as file:
+            file.write(self.SNAPSHOT_HEADER.pack(self.SNAPSHOT_MAGIC, self.SNAPSHOT_VERSION, flags, self.get_vertex_count(),
+                                                 self.get_edge_count(), weight_typecode.encode(), values_offset))
+            file.write(self.offsets)
+            file.write(self.targets)
+            file.write(self.weights)
+            if values != None:
+                file.write(values)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Open a binary snapshot written by save without parsing it. The arrays are views into a read-only memory
+        map of the file, so processes opening the same snapshot share its pages in the page cache
+        - Time Complexity: O(1) besides unpickling the vertex values, pages are read when they are first accessed
+        - Space Complexity: O(1) besides the vertex values
 
-def BFS(graph, value):
+        Note: The graph keeps the file mapped until close is called
+        """
+        with open(path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, flags, vertex_count, edge_count, weight_typecode, values_offset = cls.SNAPSHOT_HEADER.unpack_from(buffer)
+            if magic != cls.SNAPSHOT_MAGIC or version != cls.SNAPSHOT_VERSION:
+                raise ValueError("The given file is not a graph snapshot")
+            if bool(flags & cls.SNAPSHOT_BIG_ENDIAN) != (sys.byteorder == 'big'):
+                raise ValueError("The given snapshot was written on a machine with a different byte order")
+
+            # The arrays must fit in the file, followed by the pickled values if there are any
+            arrays_end = cls.SNAPSHOT_HEADER.size + 8 * (vertex_count + 1 + 2 * edge_count)
+            if vertex_count < 0 or edge_count < 0 or weight_typecode not in (b'q', b'd'):
+                raise ValueError("The given snapshot has an invalid header")
+            if flags & cls.SNAPSHOT_VALUES:
+                if values_offset != arrays_end or len(buffer) <= arrays_end:
+                    raise ValueError("The given snapshot is shorter than its header says")
+            elif len(buffer) != arrays_end:
+                raise ValueError("The given snapshot does not match the size in its header")
+        except BaseException:
+            buffer.close()
+            raise
+
+        # Slice the arrays out of the mapping without copying them
+        view = memoryview(buffer)
+        start = cls.SNAPSHOT_HEADER.size
+        offsets = view[start:start + 8 * (vertex_count + 1)].cast('q')
+        start += 8 * (vertex_count + 1)
+        targets = view[start:start + 8 * edge_count].cast('q')
+        start += 8 * edge_count
+        weights = view[start:start + 8 * edge_count].cast(weight_typecode.decode())
+
+        values = pickle.loads(view[values_offset:]) if flags & cls.SNAPSHOT_VALUES else None
+        view.release()
+
+        graph = cls(offsets, targets, weights, values, bool(flags & cls.SNAPSHOT_DIRECTED))
+        graph.path = path
+        graph.buffer = buffer
+        return graph
+
+    def close(self):
+        """
+        Release the memory map of a graph loaded from a snapshot, the graph cannot be used afterwards
+        """
+        if self.buffer != None:
+            for view in (self.offsets, self.targets, self.weights):
+                view.release()
+            self.buffer.close()
+            self.buffer = None
+
+    def get_vertices(self):
+        return range(len(self.offsets) - 1)
+
+    def get_vertex_count(self):
+        return len(self.offsets) - 1
+
+    def get_edge_count(self):
+        return len(self.targets)
+
+    def get_neighbors(self, vertex):
+        """
+        Returns the (neighbor, weight) pairs of the outgoing edges of the given vertex
+        """
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def get_value(self, vertex):
+        return self.values[vertex]
+
+    def get_edges(self):
+        """
+        Returns the (beginning, end, weight) triples of all edges in the graph, where each undirected edge is
+        returned once from its endpoint with the smaller id
+        """
+        for vertex in self.get_vertices():
+            for end, weight in self.get_neighbors(vertex):
+                if self.directed or vertex <= end:
+                    yield vertex, end, weight
+
+class Interner:
+    """
+    Interning table which gives every distinct value a dense integer id in the order the values are first seen,
+    so that algorithms can index arrays by id instead of hashing the values
+    """
+    def __init__(self, values=()):
+        self.ids = {}
+        self.values = []
+        for value in values:
+            self.intern(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, value):
+        return value in self.ids
+
+    def intern(self, value):
+        """
+        Returns the id of the given value, giving it the next id if it is new
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        id = self.ids.get(value)
+        if id == None:
+            id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return id
+
+    def get_id(self, value):
+        return self.ids[value]
+
+    def get_value(self, id):
+        return self.values[id]
+
+def read_edge_list(path, delimiter=None, value_type=str):
+    """
+    Stream the (beginning, end) or (beginning, end, weight) tuples of an edge list file with one edge per line,
+    where the fields are separated by whitespace or the given delimiter (e.g. "," for CSV files). Blank lines
+    and lines starting with "#" after any indentation are skipped, and a malformed line raises a ValueError
+    with its line number
+    - Time Complexity: O(s) where s is the size of the file
+    - Space Complexity: O(1) since the file is memory mapped instead of being read into memory
+
+    Note: Combine it with the bulk constructors, e.g. CSRGraph.from_edge_list(read_edge_list(path, value_type=int))
+    """
+    separator = delimiter.encode() if delimiter != None else None
+    with open(path, 'rb') as file:
+        # Memory mapping an empty file is not allowed
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for line_number, line in enumerate(iter(data.readline, b''), 1):
+                # Strip the line first so that indented comments are skipped with any delimiter
+                line = line.strip()
+                if line == b'' or line.startswith(b'#'):
+                    continue
+
+                fields = line.split(separator)
+                if len(fields) < 2:
+                    raise ValueError("Line %d of the edge list does not have both ends of an edge" % line_number)
+
+                try:
+                    beginning = value_type(fields[0].strip().decode())
+                    end = value_type(fields[1].strip().decode())
+                    if len(fields) < 3:
+                        yield beginning, end
+                        continue
+                    weight = fields[2].strip()
+                    weight = int(weight) if weight.lstrip(b'-').isdigit() else float(weight)
+                except ValueError:
+                    raise ValueError("Line %d of the edge list could not be parsed" % line_number) from None
+                yield beginning, end, weight
+
+def _append_weight(weights, weight):
+    # Weights are kept as integers until the first fractional weight shows up
+    if weights.typecode == 'q' and not isinstance(weight, int):
+        weights = array('d', weights)
+    weights.append(weight)
+    return weights
+
+class GraphStats:
+    """
+    Optional instrumentation for the graph algorithms which accept a stats argument, counting the settled
+    vertices, relaxed edges and heap operations and timing the phases of an algorithm. A tracer, if given,
+    is called as tracer(event, *details) for the 'settle', 'relax' and 'phase' events
+
+    Note: Without stats the algorithms only pay one comparison with None at each instrumented step
+    """
+    def __init__(self, tracer=None):
+        self.tracer = tracer
+        self.vertices_settled = 0
+        self.edges_relaxed = 0
+        self.heap_operations = 0
+        self.phase_times = {}
+
+    def settle(self, vertex):
+        self.vertices_settled += 1
+        if self.tracer != None:
+            self.tracer('settle', vertex)
+
+    def relax(self, beginning, end):
+        self.edges_relaxed += 1
+        if self.tracer != None:
+            self.tracer('relax', beginning, end)
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Add the time spent inside the with block to the total time of the named phase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phase_times[name] = self.phase_times.get(name, 0) + elapsed
+            if self.tracer != None:
+                self.tracer('phase', name, elapsed)
+
+def _phase(stats, name):
+    return stats.phase(name) if stats != None else nullcontext()
+
+class TraversalState:
+    """
+    Visited marks of a single graph search, kept outside of the graph so that many searches can share
+    one read-only graph
+
+    For CSR graphs the marks are an array of generation stamps indexed by vertex id, where a vertex is
+    visited if its stamp equals the current generation. Starting the next search only increments the
+    generation, so a state can be reused without an O(n) reset. Other graphs fall back to a set
+
+    Note: A state belongs to one search at a time, give every worker thread its own state
+    """
+    def __init__(self, graph):
+        if isinstance(graph, CSRGraph):
+            self.stamps = array('L', bytes(array('L').itemsize * graph.get_vertex_count()))
+            self.visited = None
+        else:
+            self.stamps = None
+            self.visited = set()
+        self.generation = 1
+
+    def reset(self):
+        """
+        Mark every vertex as unvisited
+        - Time Complexity: O(1) for CSR graphs, O(v) otherwise where v is the number of visited vertices
+        - Space Complexity: O(1)
+        """
+        if self.stamps == None:
+            self.visited.clear()
+            return
+
+        self.generation += 1
+        # Clear the stamps only when the generation counter wraps around
+        if self.generation >= 1 << (8 * self.stamps.itemsize):
+            self.stamps = array('L', bytes(len(self.stamps) * self.stamps.itemsize))
+            self.generation = 1
+
+    def visit(self, vertex):
+        if self.stamps == None:
+            self.visited.add(vertex)
+        else:
+            self.stamps[vertex] = self.generation
+
+    def is_visited(self, vertex):
+        if self.stamps == None:
+            return vertex in self.visited
+        return self.stamps[vertex] == self.generation
+
+def _get_traversal_state(graph, state):
+    # Searches reuse the caller's state so that a worker can run many searches without reallocating it
+    if state == None:
+        return TraversalState(graph)
+    state.reset()
+    return state
+
+def BFS(graph, value, state=None, stats=None):
     """
     Breadth First Search the given graph for a vertex with the given value
     - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
     - Space Complexity: O(n) where n is the number of vertices
     """
     def breadth_first_search(vertex):
-        vertex.visited = True
+        if visited.is_visited(vertex):
+            return None
+        visited.visit(vertex)
 
-        queue = [vertex]
+        queue = deque([vertex])
         while len(queue) > 0:
-            current_vertex = queue.pop()
+            current_vertex = queue.popleft()
+            if stats != None:
+                stats.settle(current_vertex)
 
-            if current_vertex.value == value:
+            if graph.get_value(current_vertex) == value:
                 return current_vertex
 
-            for edge in graph.get_vertex_edges(current_vertex):
-                if not edge.end.visited:
-                    queue.insert(0, edge.end)
-                    edge.end.visited = True
+            for neighbor, _ in graph.get_neighbors(current_vertex):
+                if stats != None:
+                    stats.relax(current_vertex, neighbor)
+                if not visited.is_visited(neighbor):
+                    queue.append(neighbor)
+                    visited.visit(neighbor)
         
         return None
 
     # This for loop is used for searching for a graph with disconnected components
-    graph.reset_visited()
+    visited = _get_traversal_state(graph, state)
     for vertex in graph.get_vertices():
         found = breadth_first_search(vertex)
         if found != None:
@@ -99,159 +673,1040 @@ def BFS(graph, value):
         
     return None
 
-def DFS_iterative(graph, value):
+def BFS_levels(graph, source, state=None):
     """
-    Iterative Depth First Search the given graph for a vertex with the given value
+    Level synchronous Breadth First Search from the source, which expands the whole frontier of one level
+    as a batch to build the frontier of the next level
     - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
     - Space Complexity: O(n) where n is the number of vertices
+
+    Returns the (distances, parents) pair of dictionaries for the reached vertices, where distances are
+    the number of hops from the source. Use get_path on the parents to reconstruct a shortest path
     """
-    def depth_first_search_iterative(vertex):
-        stack = [vertex]
-        while len(stack) > 0:
-            current_vertex = stack.pop()
-            if not current_vertex.visited:
-                current_vertex.visited = True
+    visited = _get_traversal_state(graph, state)
+    visited.visit(source)
 
-                if current_vertex.value == value:
-                    return current_vertex
+    distances = {source: 0}
+    parents = {source: None}
 
-                for edge in graph.get_vertex_edges(current_vertex):
-                    stack.append(edge.end)
-        
-        return None
-    
-    # This for loop is used for searching for a graph with disconnected components
-    graph.reset_visited()
-    for vertex in graph.get_vertices():
-        found = depth_first_search_iterative(vertex)
-        if found != None:
-            return found
+    frontier = [source]
+    level = 0
+    while len(frontier) > 0:
+        level += 1
+        next_frontier = []
+
+        # Every vertex of the next level is discovered by expanding the current level at once
+        for current_vertex in frontier:
+            for neighbor, _ in graph.get_neighbors(current_vertex):
+                if not visited.is_visited(neighbor):
+                    visited.visit(neighbor)
+                    distances[neighbor] = level
+                    parents[neighbor] = current_vertex
+                    next_frontier.append(neighbor)
+
+        frontier = next_frontier
+
+    return distances, parents
+
+def DFS_iterative(graph, value, state=None, stats=None):
+    """
+    Iterative Depth First Search the given graph for a vertex with the given value
+    - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+    - Space Complexity: O(n) where n is the number of vertices
+    """
+    for event, vertex, _ in DFS_events(graph, state=state, stats=stats):
+        if event == 'discover' and graph.get_value(vertex) == value:
+            return vertex
         
     return None
 
-def DFS_recursive(graph, value):
+def DFS_events(graph, sources=None, state=None, stats=None):
+    """
+    Iterative Depth First Search engine which yields the (event, vertex, other) steps of the search, starting from
+    each of the given sources (every vertex if None) that is not discovered yet
+    - ('discover', vertex, parent) and ('finish', vertex, parent) when a vertex is entered and left, parent is
+      None for the roots of the search
+    - ('tree', u, v), ('back', u, v), ('forward', u, v) and ('cross', u, v) for each edge u -> v, classified by
+      whether v is undiscovered, still on the stack, a finished descendant of u or finished elsewhere
+    - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+    - Space Complexity: O(n) where n is the number of vertices
+
+    Note: The stack holds one entry per vertex on the current path, so the depth is not limited by recursion.
+          In an undirected graph the edge back to the parent is reported as a back edge. For CSR graphs the
+          discovery times and finished marks are arrays indexed by vertex id instead of dictionaries
+    """
+    discovered = _get_traversal_state(graph, state)
+    if isinstance(graph, CSRGraph):
+        discovery_times = array('q', [-1]) * graph.get_vertex_count()
+        finished = bytearray(graph.get_vertex_count())
+    else:
+        discovery_times = {}
+        finished = {}
+    discovery_count = 0
+
+    for root in (graph.get_vertices() if sources == None else sources):
+        if discovered.is_visited(root):
+            continue
+
+        discovered.visit(root)
+        discovery_times[root] = discovery_count
+        discovery_count += 1
+        finished[root] = False
+        if stats != None:
+            stats.settle(root)
+        yield 'discover', root, None
+
+        # Each stack entry remembers where the scan of its vertex' edges stopped
+        stack = [(root, iter(graph.get_neighbors(root)))]
+        while len(stack) > 0:
+            current_vertex, neighbors = stack[-1]
+            for neighbor, _ in neighbors:
+                if stats != None:
+                    stats.relax(current_vertex, neighbor)
+                if not discovered.is_visited(neighbor):
+                    yield 'tree', current_vertex, neighbor
+                    discovered.visit(neighbor)
+                    discovery_times[neighbor] = discovery_count
+                    discovery_count += 1
+                    finished[neighbor] = False
+                    if stats != None:
+                        stats.settle(neighbor)
+                    yield 'discover', neighbor, current_vertex
+                    stack.append((neighbor, iter(graph.get_neighbors(neighbor))))
+                    break
+                elif not finished[neighbor]:
+                    yield 'back', current_vertex, neighbor
+                elif discovery_times[current_vertex] < discovery_times[neighbor]:
+                    yield 'forward', current_vertex, neighbor
+                else:
+                    yield 'cross', current_vertex, neighbor
+            else:
+                # All edges of the vertex are scanned
+                stack.pop()
+                finished[current_vertex] = True
+                yield 'finish', current_vertex, stack[-1][0] if len(stack) > 0 else None
+
+def has_cycle(graph):
+    """
+    Returns whether the given directed graph has a cycle, which is the case if and only if a Depth First Search
+    finds a back edge
+    - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+    - Space Complexity: O(n) where n is the number of vertices
+    """
+    for event, _, _ in DFS_events(graph):
+        if event == 'back':
+            return True
+    return False
+
+def articulation_points(graph):
+    """
+    Find the articulation points of an undirected graph, the vertices whose removal disconnects their component.
+    A non-root vertex u is one if some child v in the search tree cannot reach above u without passing u, that is
+    low(v) >= discovery(u), and a root is one if it has more than one child
+    - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+    - Space Complexity: O(n) where n is the number of vertices
+    """
+    discovery_times = {}
+    low = {}
+    parents = {}
+    root_children = {}
+    points = []
+    found = set()
+
+    for event, vertex, other in DFS_events(graph):
+        if event == 'discover':
+            discovery_times[vertex] = low[vertex] = len(discovery_times)
+            parents[vertex] = other
+            if other == None:
+                root_children[vertex] = 0
+        elif event == 'tree' and parents[vertex] == None:
+            root_children[vertex] += 1
+        elif event == 'back' and other != parents[vertex]:
+            low[vertex] = min(low[vertex], discovery_times[other])
+        elif event == 'finish' and other != None:
+            low[other] = min(low[other], low[vertex])
+            if parents[other] != None and low[vertex] >= discovery_times[other] and other not in found:
+                found.add(other)
+                points.append(other)
+        elif event == 'finish' and root_children[vertex] > 1:
+            points.append(vertex)
+
+    return points
+
+def DFS_recursive(graph, value, state=None):
     """
     Recursive Depth First Search the given graph for a vertex with the given value
     - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
     - Space Complexity: O(n) where n is the number of vertices
+
+    Note: Each vertex on the current path takes a Python stack frame, so paths deeper than the recursion limit
+          (about 1000) raise RecursionError. DFS_iterative and DFS_events have no such limit
     """
     def depth_first_search_recursive(vertex):
-        vertex.visited = True
+        visited.visit(vertex)
 
-        if vertex.value == value:
+        if graph.get_value(vertex) == value:
             return vertex
             
-        for edge in graph.get_vertex_edges(vertex):
-            if not edge.end.visited:
-                found = depth_first_search_recursive(edge.end)
+        for neighbor, _ in graph.get_neighbors(vertex):
+            if not visited.is_visited(neighbor):
+                found = depth_first_search_recursive(neighbor)
                 if found != None:
                     return found
 
         return None
 
     # This for loop is used for searching for a graph with disconnected components
-    graph.reset_visited()
+    visited = _get_traversal_state(graph, state)
     for vertex in graph.get_vertices():
+        if visited.is_visited(vertex):
+            continue
         found = depth_first_search_recursive(vertex)
         if found != None:
             return found
         
     return None
 
-def Kruskal(graph):
+def Tarjan(graph):
+    """
+    Tarjan's algorithm finds the strongly connected components of a directed graph, the maximal sets of vertices
+    which can all reach each other. A vertex is the root of a component if no vertex in its search subtree links
+    back above it, i.e. its low-link equals its own discovery index
+    - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+    - Space Complexity: O(n) where n is the number of vertices
+
+    Returns the components as lists of vertices in reverse topological order of the condensation
+
+    Note: Runs on the iterative DFS_events engine, so it is not limited by the recursion limit. For CSR graphs
+          the indices, low-links and stack marks are arrays indexed by vertex id instead of dictionaries
+    """
+    if isinstance(graph, CSRGraph):
+        indices = array('q', [-1]) * graph.get_vertex_count()
+        low = array('q', [-1]) * graph.get_vertex_count()
+        on_stack = bytearray(graph.get_vertex_count())
+    else:
+        indices = {}
+        low = {}
+        on_stack = {}
+    index = 0
+    component_stack = []
+    components = []
+
+    for event, vertex, other in DFS_events(graph):
+        if event == 'discover':
+            indices[vertex] = low[vertex] = index
+            index += 1
+            component_stack.append(vertex)
+            on_stack[vertex] = True
+        elif event in ('back', 'cross', 'forward'):
+            # Only edges into the components that are still open can lower the low-link
+            if on_stack[other]:
+                low[vertex] = min(low[vertex], indices[other])
+        elif event == 'finish':
+            if low[vertex] == indices[vertex]:
+                component = []
+                while True:
+                    member = component_stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == vertex:
+                        break
+                components.append(component)
+
+            if other != None:
+                low[other] = min(low[other], low[vertex])
+
+    return components
+
+def condensation(graph):
+    """
+    Build the condensation of a directed graph, the Directed Acyclic Graph with one vertex per strongly connected
+    component and one edge between two components if any of their vertices are connected
+    - Time Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+    - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+
+    Returns (components, dag), where the components are in topological order and the vertex values of the dag
+    are the indices of their components. The dag is a CSRGraph for a CSRGraph and a DirectedGraph otherwise
+    """
+    components = Tarjan(graph)
+    components.reverse()
+
+    component_ids = {}
+    for component_id, component in enumerate(components):
+        for vertex in component:
+            component_ids[vertex] = component_id
+
+    # Add each edge between two components once, remembering which component last added an edge to each target
+    sources = array('q')
+    targets = array('q')
+    last_source = array('q', [-1]) * len(components)
+    for component_id, component in enumerate(components):
+        for vertex in component:
+            for neighbor, _ in graph.get_neighbors(vertex):
+                neighbor_id = component_ids[neighbor]
+                if neighbor_id != component_id and last_source[neighbor_id] != component_id:
+                    last_source[neighbor_id] = component_id
+                    sources.append(component_id)
+                    targets.append(neighbor_id)
+
+    graph_class = CSRGraph if isinstance(graph, CSRGraph) else DirectedGraph
+    return components, graph_class.from_arrays(sources, targets, values=range(len(components)))
+
+def Kruskal(graph, stats=None):
     """
     Kruskal's algorithm to find the minimum spanning forest in a weighted, undirected graph
     - Time Complexity: O(mlogm) where m is the number of edges
+    - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+
+    Note: Vertices can have any values, the disjoint sets are keyed by the vertices themselves
+    """
+    spanning_tree = []
+    vertices = graph.get_vertices()
+    if isinstance(graph, CSRGraph):
+        vertex_sets = unionFind.DisjointSetArray(len(vertices))
+    else:
+        vertex_sets = unionFind.DisjointSetDict(vertices)
+
+    # Iterate over the edges sorted by their weight, where each undirected edge appears once
+    with _phase(stats, 'sort'):
+        edges = sorted(graph.get_edges(), key=lambda edge : edge[2])
+
+    with _phase(stats, 'merge'):
+        for beginning, end, _ in edges:
+            if stats != None:
+                stats.relax(beginning, end)
+
+            # If the edge does not create a cycle, add it to the spanning tree and mark vertices as connected
+            if vertex_sets.union(beginning, end):
+                spanning_tree.append((graph.get_value(beginning), graph.get_value(end)))
+            
+            # Stop when the total number of edges in spanning tree is V - 1
+            if len(spanning_tree) + 1 == len(vertices):
+                break
+
+    return spanning_tree
+
+def Prim(graph):
+    """
+    Prim's algorithm to find the minimum spanning forest in a weighted, undirected graph by growing one tree
+    at a time from its cheapest connecting edge
+    - Time Complexity: O(mlogn) where n is the number of vertices and m is the number of edges
     - Space Complexity: O(n) where n is the number of vertices
+
+    Note: Unlike Kruskal, the edges are never sorted up front, which pays off on dense graphs
     """
-    def union(set, x, y):
-        set[x] = y
-        
-    def find(set, x):
-        # Using path compression by reassigning each parent
-        if set[x] != x:
-            set[x] = find(set, set[x])
-        return set[x]
-        
     spanning_tree = []
-    vertex_sets = list(map(lambda vertex : vertex.value, graph.get_vertices()))
-
-    # Iterate over a list of edges, sorted by their weight
-    edges = sorted(set([edge for vertex in graph.get_vertices() for edge in graph.get_vertex_edges(vertex)]), key=lambda edge : edge.weight)
-    for edge in edges:
-        # If the edge does not create a cycle, add it to the spanning tree and mark vertices as connected
-        if find(vertex_sets, edge.beginning.value) != find(vertex_sets, edge.end.value):
-            spanning_tree.append((edge.beginning.value, edge.end.value))
-            union(vertex_sets, edge.beginning.value, edge.end.value)
-        
-        # Stop when the total number of edges in spanning tree is V - 1
-        if len(spanning_tree) + 1 == len(vertex_sets):
-            break
+    in_tree = set()
+    parents = {}
+
+    for root in graph.get_vertices():
+        if root in in_tree:
+            continue
+
+        # The frontier holds the cheapest known edge weight connecting each vertex to the current tree
+        frontier = heap.IndexedMinBinaryHeap()
+        frontier.insert(root, 0)
+        parents[root] = None
+
+        while len(frontier) > 0:
+            current_vertex, _ = frontier.remove_min()
+            in_tree.add(current_vertex)
+            if parents[current_vertex] != None:
+                spanning_tree.append((graph.get_value(parents[current_vertex]), graph.get_value(current_vertex)))
+
+            for neighbor, weight in graph.get_neighbors(current_vertex):
+                if neighbor in in_tree:
+                    continue
+
+                if neighbor not in frontier:
+                    frontier.insert(neighbor, weight)
+                    parents[neighbor] = current_vertex
+                elif weight < frontier.get_priority(neighbor):
+                    frontier.decrease_key(neighbor, weight)
+                    parents[neighbor] = current_vertex
+
+    return spanning_tree
+
+# Edge arrays of the graph being processed, copied into every Boruvka worker process once
+_boruvka_edges = None
+
+def _init_boruvka_worker(sources, targets, weights):
+    global _boruvka_edges
+    _boruvka_edges = (sources, targets, weights)
+
+def _find_cheapest_worker_edges(components, start, end):
+    return _find_cheapest_edges(_boruvka_edges, components, start, end)
+
+def _find_cheapest_edges(edges, components, start, end):
+    """
+    Find the cheapest edge leaving each component among the edges start..end-1, where ties are broken by
+    edge index so that all chunks agree on a single cheapest edge
+    """
+    sources, targets, weights = edges
+    cheapest = {}
+    for index in range(start, end):
+        beginning_component = components[sources[index]]
+        end_component = components[targets[index]]
+        if beginning_component == end_component:
+            continue
+
+        candidate = (weights[index], index)
+        for component in (beginning_component, end_component):
+            if component not in cheapest or candidate < cheapest[component]:
+                cheapest[component] = candidate
+
+    return cheapest
+
+def Boruvka(graph, max_workers=None, chunk_size=100000):
+    """
+    Boruvka's algorithm to find the minimum spanning forest in a weighted, undirected graph. Every round adds
+    the cheapest edge leaving each component, so there are at most logn rounds
+    - Time Complexity: O(mlogn) where n is the number of vertices and m is the number of edges
+    - Space Complexity: O(n + m) where n is the number of vertices and m is the number of edges
+
+    Note: With max_workers the edges are split into at most max_workers ranges of at least chunk_size edges
+          whose cheapest edges are found in parallel on a process pool. The edges are copied into each worker
+          once, and every round sends the component labels once per range. Otherwise each round scans all
+          edges in this process
+    """
+    vertices = graph.get_vertices()
+    ids = {vertex: index for index, vertex in enumerate(vertices)}
+
+    # Copy the edges into flat arrays once, so that only the component labels travel to the workers in each round
+    sources = array('q')
+    targets = array('q')
+    weights = array('q')
+    for beginning, end, weight in graph.get_edges():
+        sources.append(ids[beginning])
+        targets.append(ids[end])
+        weights = _append_weight(weights, weight)
+
+    spanning_tree = []
+    vertex_sets = unionFind.DisjointSetArray(len(vertices))
+    edges = (sources, targets, weights)
+
+    executor = None
+    if max_workers != None:
+        executor = ProcessPoolExecutor(max_workers, initializer=_init_boruvka_worker, initargs=edges)
+
+        # One range per worker, unless the graph is too small to make the ranges worth sending
+        range_count = max(1, min(max_workers, len(sources) // chunk_size))
+        starts = [len(sources) * i // range_count for i in range(range_count)]
+        ends = starts[1:] + [len(sources)]
+
+    try:
+        while True:
+            components = array('q', (vertex_sets.find(vertex) for vertex in range(len(vertices))))
+
+            # Merge the cheapest edge of each component over all chunks
+            if executor != None:
+                results = executor.map(_find_cheapest_worker_edges, [components] * len(starts), starts, ends)
+            else:
+                results = [_find_cheapest_edges(edges, components, 0, len(sources))]
+
+            cheapest = {}
+            for chunk_cheapest in results:
+                for component, candidate in chunk_cheapest.items():
+                    if component not in cheapest or candidate < cheapest[component]:
+                        cheapest[component] = candidate
+
+            if len(cheapest) == 0:
+                break
+
+            # Contract the components along their cheapest edges, an edge chosen by both of its sides is added once
+            for _, index in sorted(cheapest.values()):
+                if vertex_sets.union(sources[index], targets[index]):
+                    spanning_tree.append((graph.get_value(vertices[sources[index]]), graph.get_value(vertices[targets[index]])))
+    finally:
+        if executor != None:
+            executor.shutdown()
 
     return spanning_tree
 
-def Dijkstra(graph, source):
+def Dijkstra(graph, source, stats=None):
     """
     Dijkstra's algorithm to find the shortest path from the source node to all other nodes in a weighted graph
     - Time Complexity: O(nlogn + mlogn) where n is the number of vertices and m is the number of edges
-                       Note that the current implementation does not use a priority queue, therefore O(n^2)
     - Space Complexity: O(n) where n is the number of vertices
+
+    Note: Vertices that cannot be reached from the source keep the distance sys.maxsize
+    """
+    distances = dict.fromkeys(graph.get_vertices(), sys.maxsize)
+    settled_distances, _ = Dijkstra_search(graph, source, stats=stats)
+    distances.update(settled_distances)
+    return distances
+
+def Dijkstra_search(graph, source, targets=None, state=None, stats=None):
+    """
+    Dijkstra's algorithm driven by an indexed priority queue which records the predecessor of every settled
+    vertex and stops as soon as all of the given targets are settled
+    - Time Complexity: O(nlogn + mlogn) where n is the number of vertices and m is the number of edges
+                       Only the vertices closer than the farthest target are visited when targets are given
+    - Space Complexity: O(n) where n is the number of vertices
+
+    Returns the (distances, predecessors) pair of dictionaries for the settled vertices, use get_path to
+    reconstruct the shortest path to any of them. Vertices left on the frontier by an early stop are not
+    included, since their distances and predecessors are only tentative
+
+    Note: For CSR graphs the tentative predecessors are an array indexed by vertex id, and only the ones of
+          the settled vertices are copied into the returned dictionary
+    """
+    remaining_targets = set(targets) if targets != None else None
+    settled = _get_traversal_state(graph, state)
+
+    distances = {}
+    if isinstance(graph, CSRGraph):
+        predecessors = array('q', [-1]) * graph.get_vertex_count()
+    else:
+        predecessors = {source: None}
+
+    # The priority queue only holds the frontier, each vertex is in it at most once
+    frontier = heap.IndexedMinBinaryHeap()
+    frontier.insert(source, 0)
+
+    while len(frontier) > 0:
+        # Settle the frontier vertex with the minimum tentative distance
+        current_vertex, current_distance = frontier.remove_min()
+        distances[current_vertex] = current_distance
+        settled.visit(current_vertex)
+        if stats != None:
+            stats.heap_operations += 1
+            stats.settle(current_vertex)
+
+        # Stop early once every target has its final distance
+        if remaining_targets != None:
+            remaining_targets.discard(current_vertex)
+            if len(remaining_targets) == 0:
+                break
+
+        # Relax the edges of the settled vertex by lowering the priorities of its neighbours in place
+        for neighbor, weight in graph.get_neighbors(current_vertex):
+            if settled.is_visited(neighbor):
+                continue
+            if stats != None:
+                stats.relax(current_vertex, neighbor)
+
+            new_distance = current_distance + weight
+            if neighbor not in frontier:
+                frontier.insert(neighbor, new_distance)
+                predecessors[neighbor] = current_vertex
+            elif new_distance < frontier.get_priority(neighbor):
+                frontier.decrease_key(neighbor, new_distance)
+                predecessors[neighbor] = current_vertex
+            else:
+                continue
+
+            if stats != None:
+                stats.heap_operations += 1
+
+    if isinstance(predecessors, array):
+        predecessors = {vertex: predecessors[vertex] if vertex != source else None for vertex in distances}
+    else:
+        # Drop the tentative predecessors of the frontier left by an early stop
+        for vertex in frontier.heap:
+            del predecessors[vertex]
+
+    return distances, predecessors
+
+def Dijkstra_bidirectional(graph, source, target, reverse_graph=None):
+    """
+    Bidirectional Dijkstra's algorithm to find the shortest path between two vertices by searching forwards from
+    the source and backwards from the target until the two searches meet
+    - Time Complexity: O(nlogn + mlogn) where n is the number of vertices and m is the number of edges
+                       In practice each search only covers a ball of about half the distance around its end
+    - Space Complexity: O(n) where n is the number of vertices
+
+    Returns (distance, path, settled count), where the distance is sys.maxsize and the path is None if the target
+    is unreachable. Pass graph.transpose() as reverse_graph to reuse it across queries on a directed graph
+    """
+    if reverse_graph == None:
+        reverse_graph = graph.transpose()
+
+    # Index 0 holds the forward search from the source and index 1 the backward search from the target
+    graphs = (graph, reverse_graph)
+    distances = ({source: 0}, {target: 0})
+    parents = ({source: None}, {target: None})
+    settled = (set(), set())
+    frontiers = (heap.IndexedMinBinaryHeap(), heap.IndexedMinBinaryHeap())
+    frontiers[0].insert(source, 0)
+    frontiers[1].insert(target, 0)
+
+    best_distance = sys.maxsize
+    meeting_vertex = None
+    settled_count = 0
+
+    while len(frontiers[0]) > 0 and len(frontiers[1]) > 0:
+        # No path through the unsettled vertices can be shorter than the best path found so far
+        forward_minimum = frontiers[0].peek()[1]
+        backward_minimum = frontiers[1].peek()[1]
+        if forward_minimum + backward_minimum >= best_distance:
+            break
+
+        # Advance the search whose frontier is closer to its end
+        side = 0 if forward_minimum <= backward_minimum else 1
+        other_side = 1 - side
+        current_vertex, current_distance = frontiers[side].remove_min()
+        settled[side].add(current_vertex)
+        settled_count += 1
+
+        if current_vertex in distances[other_side] and current_distance + distances[other_side][current_vertex] < best_distance:
+            best_distance = current_distance + distances[other_side][current_vertex]
+            meeting_vertex = current_vertex
+
+        for neighbor, weight in graphs[side].get_neighbors(current_vertex):
+            if neighbor in settled[side]:
+                continue
+
+            new_distance = current_distance + weight
+            if neighbor not in distances[side] or new_distance < distances[side][neighbor]:
+                if neighbor in frontiers[side]:
+                    frontiers[side].decrease_key(neighbor, new_distance)
+                else:
+                    frontiers[side].insert(neighbor, new_distance)
+                distances[side][neighbor] = new_distance
+                parents[side][neighbor] = current_vertex
+
+            # An edge reaching a vertex seen by the other search closes a source to target path
+            if neighbor in distances[other_side] and distances[side][neighbor] + distances[other_side][neighbor] < best_distance:
+                best_distance = distances[side][neighbor] + distances[other_side][neighbor]
+                meeting_vertex = neighbor
+
+    if meeting_vertex == None:
+        return sys.maxsize, None, settled_count
+
+    # Join the forward path to the meeting vertex with the backward path from it
+    path = get_path(parents[0], meeting_vertex)
+    current_vertex = parents[1][meeting_vertex]
+    while current_vertex != None:
+        path.append(current_vertex)
+        current_vertex = parents[1][current_vertex]
+
+    return best_distance, path, settled_count
+
+def A_star(graph, source, target, heuristic):
+    """
+    A* search to find the shortest path between two vertices, which settles vertices by their distance from the
+    source plus heuristic(vertex), an estimate of their remaining distance to the target
+    - Time Complexity: O(nlogn + mlogn) where n is the number of vertices and m is the number of edges
+                       A tighter heuristic settles fewer vertices, a zero heuristic is Dijkstra's algorithm
+    - Space Complexity: O(n) where n is the number of vertices
+
+    Returns (distance, path, settled count), where the distance is sys.maxsize and the path is None if the target
+    is unreachable
+
+    Note: The heuristic must never overestimate the remaining distance for the path to be the shortest. Vertices
+          are reopened when a shorter path to them is found, so the heuristic does not have to be consistent
+    """
+    distances = {source: 0}
+    parents = {source: None}
+    settled_count = 0
+
+    # The indexed heap holds each open vertex once, so there are never stale entries to skip
+    frontier = heap.IndexedMinBinaryHeap()
+    frontier.insert(source, heuristic(source))
+
+    while len(frontier) > 0:
+        current_vertex, _ = frontier.remove_min()
+        settled_count += 1
+
+        if current_vertex == target:
+            return distances[target], get_path(parents, target), settled_count
+
+        for neighbor, weight in graph.get_neighbors(current_vertex):
+            new_distance = distances[current_vertex] + weight
+            if neighbor in distances and new_distance >= distances[neighbor]:
+                continue
+
+            distances[neighbor] = new_distance
+            parents[neighbor] = current_vertex
+            if neighbor in frontier:
+                frontier.decrease_key(neighbor, new_distance + heuristic(neighbor))
+            else:
+                frontier.insert(neighbor, new_distance + heuristic(neighbor))
+
+    return sys.maxsize, None, settled_count
+
+# Read-only graph and reusable search state of a many-source shortest path worker process
+_shared_graph = None
+_shared_state = None
+
+def _init_shortest_path_worker(graph_source):
+    global _shared_graph, _shared_state
+    if isinstance(graph_source, str):
+        # Every worker maps the same snapshot file, so they all share its pages
+        _shared_graph = CSRGraph.load(graph_source)
+    else:
+        _shared_graph = CSRGraph(*graph_source)
+    _shared_state = TraversalState(_shared_graph)
+
+def _find_shortest_path_row(graph, source, state):
+    distances, _ = Dijkstra_search(graph, source, state=state)
+    row = [sys.maxsize] * graph.get_vertex_count()
+    for vertex, distance in distances.items():
+        row[vertex] = distance
+    return row
+
+def _find_shortest_path_rows(sources):
+    return [(source, _find_shortest_path_row(_shared_graph, source, _shared_state)) for source in sources]
+
+def Dijkstra_many(graph, sources, max_workers=None, chunk_size=16):
     """
-    # Mark all vertices as unvisited
-    graph.reset_visited()
+    Run Dijkstra's algorithm from each of the given sources and yield the (source, row) pairs as they finish, where
+    row[i] is the distance to the vertex with id i, the position of the vertex in graph.get_vertices()
+    - Time Complexity: O(s(nlogn + mlogn)) where s is the number of sources, spread over the workers
+    - Space Complexity: O(n + m) for each worker where n is the number of vertices and m is the number of edges
 
-    # Create a set of unvisited vertices
-    unvisited_vertices = graph.get_vertices()
+    Note: With max_workers the sources are sent in chunks of chunk_size to a process pool and the rows come back
+          in the order they finish. Each worker gets the graph once as CSR arrays, or maps the snapshot file if
+          the graph was loaded with CSRGraph.load. Without max_workers the rows are computed in this process
+    """
+    if isinstance(graph, CSRGraph):
+        csr_graph = graph
+        source_ids = list(sources)
+        source_vertices = source_ids
+    else:
+        vertices = graph.get_vertices()
+        ids = {vertex: index for index, vertex in enumerate(vertices)}
+        csr_graph = CSRGraph.from_graph(graph)
+        source_vertices = list(sources)
+        source_ids = [ids[source] for source in source_vertices]
 
-    # Create a list of distances from the source node to a specific node with initial value = +inf
-    distances = dict.fromkeys(unvisited_vertices, sys.maxsize)
-    distances[source] = 0
+    # Without workers the rows are computed on this graph with a state of this generator, so that generators
+    # running at the same time do not share anything
+    if max_workers == None:
+        state = TraversalState(csr_graph)
+        for source_vertex, source in zip(source_vertices, source_ids):
+            yield source_vertex, _find_shortest_path_row(csr_graph, source, state)
+        return
 
-    while len(unvisited_vertices) > 0:
-        # Set the current vertex to the unvisited node with the minimum distance
-        current_vertex = min(unvisited_vertices, key=lambda vertex : distances[vertex])
+    chunks = [source_ids[start:start + chunk_size] for start in range(0, len(source_ids), chunk_size)]
+    vertices_by_id = dict(zip(source_ids, source_vertices))
+    if csr_graph.path != None:
+        graph_source = csr_graph.path
+    else:
+        graph_source = (csr_graph.offsets, csr_graph.targets, csr_graph.weights, None, csr_graph.directed)
 
-        # Mark the current vertex as visited and remove it from the unvisited vertices set
-        current_vertex.visited = True
-        unvisited_vertices.remove(current_vertex)
+    with ProcessPoolExecutor(max_workers, initializer=_init_shortest_path_worker, initargs=(graph_source,)) as executor:
+        futures = [executor.submit(_find_shortest_path_rows, chunk) for chunk in chunks]
+        try:
+            for future in as_completed(futures):
+                for source, row in future.result():
+                    yield vertices_by_id[source], row
+        finally:
+            for future in futures:
+                future.cancel()
 
-        # For the current vertex, visit all of its unvisited neighbours and update their distance
-        for edge in graph.get_vertex_edges(current_vertex):
-            if not edge.end.visited and distances[current_vertex] + edge.weight < distances[edge.end]:
-                distances[edge.end] = distances[current_vertex] + edge.weight
+def Floyd_Warshall(graph):
+    """
+    Floyd-Warshall algorithm to find the shortest paths between all pairs of vertices, allowing a path to go
+    through vertex k in the k-th round
+    - Time Complexity: O(n^3) where n is the number of vertices
+    - Space Complexity: O(n^2) where n is the number of vertices
+
+    Returns the distance matrix indexed by the positions of the vertices in graph.get_vertices(), where
+    unreachable pairs have the distance sys.maxsize
+
+    Note: Each round rebuilds whole rows with a comprehension instead of updating single cells, which keeps the
+          inner loop out of the interpreter's slow path. Negative weights are allowed without negative cycles
+    """
+    vertices = graph.get_vertices()
+    ids = {vertex: index for index, vertex in enumerate(vertices)}
+    infinity = sys.maxsize
+
+    distances = [[infinity] * len(vertices) for _ in vertices]
+    for index, vertex in enumerate(vertices):
+        distances[index][index] = 0
+        row = distances[index]
+        for neighbor, weight in graph.get_neighbors(vertex):
+            if weight < row[ids[neighbor]]:
+                row[ids[neighbor]] = weight
+
+    for k in range(len(vertices)):
+        row_k = distances[k]
+        for i in range(len(vertices)):
+            distance_ik = distances[i][k]
+            if distance_ik == infinity:
+                continue
+            distances[i] = [distance_ij if distance_kj == infinity or distance_ij <= distance_ik + distance_kj else distance_ik + distance_kj
+                            for distance_ij, distance_kj in zip(distances[i], row_k)]
 
     return distances
 
-def Kahn(graph):
+class DynamicShortestPaths:
+    """
+    Single source shortest paths of a graph which are kept up to date while edges change
+
+    Inserting an edge or lowering a weight can only shorten paths, so the distances are repaired by a Dijkstra
+    search seeded with the improved vertex which stops wherever the distances do not improve. Removing or raising
+    the weight of an edge of the shortest path tree may lengthen paths, which falls back to a full search
+    - Time Complexity: O(a loga + b) per insertion or decrease where a is the number of vertices whose distance
+                       improves and b is the number of their edges
+    - Space Complexity: O(n) where n is the number of vertices
+
+    Note: Subscribes to the edge changes of the graph until close is called
+    """
+    def __init__(self, graph, source):
+        self.graph = graph
+        self.source = source
+        self.full_searches = 0
+        self.search()
+        graph.subscribe(self.on_edge_change)
+
+    def close(self):
+        self.graph.unsubscribe(self.on_edge_change)
+
+    def search(self):
+        self.distances, self.parents = Dijkstra_search(self.graph, self.source)
+        self.full_searches += 1
+
+    def get_distance(self, vertex):
+        return self.distances.get(vertex, sys.maxsize)
+
+    def get_path(self, vertex):
+        return get_path(self.parents, vertex)
+
+    def on_edge_change(self, event, edge):
+        tree_edge = self.parents.get(edge.end) == edge.beginning and edge.beginning in self.distances
+        if event == 'remove':
+            if tree_edge:
+                self.search()
+        elif event == 'weight' and tree_edge and self.distances[edge.beginning] + edge.weight > self.distances[edge.end]:
+            self.search()
+        else:
+            self.relax(edge.beginning, edge.end, edge.weight)
+            if isinstance(self.graph, UndirectedGraph):
+                self.relax(edge.end, edge.beginning, edge.weight)
+
+    def relax(self, beginning, end, weight):
+        """
+        Lower the distance of the end of the given edge if the edge shortens it and push the improvement forward
+        """
+        if beginning not in self.distances or self.distances[beginning] + weight >= self.get_distance(end):
+            return
+
+        self.distances[end] = self.distances[beginning] + weight
+        self.parents[end] = beginning
+
+        # Only the vertices whose distance improves enter the frontier
+        frontier = heap.IndexedMinBinaryHeap()
+        frontier.insert(end, self.distances[end])
+        while len(frontier) > 0:
+            current_vertex, current_distance = frontier.remove_min()
+            for neighbor, weight in self.graph.get_neighbors(current_vertex):
+                if current_distance + weight < self.get_distance(neighbor):
+                    self.distances[neighbor] = current_distance + weight
+                    self.parents[neighbor] = current_vertex
+                    if neighbor in frontier:
+                        frontier.decrease_key(neighbor, current_distance + weight)
+                    else:
+                        frontier.insert(neighbor, current_distance + weight)
+
+def get_path(predecessors, target):
+    """
+    Reconstruct the path from the source to the given target by walking the predecessors of a search backwards
+    - Time Complexity: O(p) where p is the number of vertices on the path
+    - Space Complexity: O(p) where p is the number of vertices on the path
+
+    Returns None if the target was not reached by the search
+    """
+    if target not in predecessors:
+        return None
+
+    path = []
+    current_vertex = target
+    while current_vertex != None:
+        path.append(current_vertex)
+        current_vertex = predecessors[current_vertex]
+
+    path.reverse()
+    return path
+
+def Kahn(graph, stats=None):
     """
     Kahn's algorithm finds the topological sort of a Directed Acyclic Graph. If there is no such sort, then the
     graph has a cycle
     - Time Complexity: O(m + n): where m is the number of edges and n is the number of vertices
     - Space Complexity: O(n) where n is the number of vertices
+
+    Note: Edges are removed from a private copy of the in-degrees, so the graph itself is left untouched
     """
-    # Topological sort of vertices
-    sorted_vertices = []
+    return list(TopologicalSort(graph, stats))
 
-    # Find a set of vertices with initially no incoming edge
-    independent_vertices = set()
-    for vertex in graph.get_vertices():
-        if vertex.inDegree == 0:
-            independent_vertices.add(vertex)
-    
-    while len(independent_vertices) > 0:
-        # Get a random vertex from the vertex set with no incoming edges and add it to the sort
-        current_vertex = independent_vertices.pop()
-        sorted_vertices.append(current_vertex)
+class TopologicalSort:
+    """
+    Streaming topological sort based on Kahn's algorithm, which works on a private array of in-degrees
+    and leaves the graph untouched
 
-        # Remove each outbound edge of this vertex. If a vertex has no incoming edge afterwards, add it to the set
-        edges = graph.get_vertex_edges(current_vertex)[:]
-        for edge in edges:
-            graph.remove_edge(edge)
-            if edge.end.inDegree == 0:
-                independent_vertices.add(edge.end)
-    
-    return sorted_vertices
+    Iterating over the sort yields each vertex as soon as all of its predecessors were yielded. A scheduler
+    can instead take the vertices with get_ready and report them with done in any order, so that the
+    dependents of a vertex are released as soon as that vertex finishes
+    """
+    def __init__(self, graph, stats=None):
+        self.graph = graph
+        self.stats = stats
+
+        # Count the incoming edges of every vertex, in an array when the vertices are integer ids
+        with _phase(stats, 'count'):
+            if isinstance(graph, CSRGraph):
+                self.in_degrees = array('q', bytes(8 * graph.get_vertex_count()))
+                for end in graph.targets:
+                    self.in_degrees[end] += 1
+            else:
+                self.in_degrees = dict.fromkeys(graph.get_vertices(), 0)
+                for vertex in self.in_degrees:
+                    for neighbor, _ in graph.get_neighbors(vertex):
+                        self.in_degrees[neighbor] += 1
 
+        # Vertices with no incoming edge are ready from the start
+        self.ready = deque(vertex for vertex in graph.get_vertices() if self.in_degrees[vertex] == 0)
+        self.pending = 0
+
+    def __iter__(self):
+        while len(self.ready) > 0:
+            current_vertex = self.ready.popleft()
+            self.pending += 1
+            yield current_vertex
+            self.done(current_vertex)
+
+    def is_active(self):
+        """
+        Returns whether there are vertices that are ready or handed out but not done yet
+        """
+        return len(self.ready) > 0 or self.pending > 0
+
+    def get_ready(self):
+        """
+        Hand out all vertices whose predecessors are done
+        - Time Complexity: O(r) where r is the number of ready vertices
+        - Space Complexity: O(r) where r is the number of ready vertices
+        """
+        ready_vertices = list(self.ready)
+        self.ready.clear()
+        self.pending += len(ready_vertices)
+        return ready_vertices
+
+    def done(self, vertex):
+        """
+        Remove the outgoing edges of a handed out vertex and release the neighbours left with no incoming edge
+        - Time Complexity: O(d) where d is the out-degree of the vertex
+        - Space Complexity: O(1)
+        """
+        self.pending -= 1
+        if self.stats != None:
+            self.stats.settle(vertex)
+        for neighbor, _ in self.graph.get_neighbors(vertex):
+            if self.stats != None:
+                self.stats.relax(vertex, neighbor)
+            self.in_degrees[neighbor] -= 1
+            if self.in_degrees[neighbor] == 0:
+                self.ready.append(neighbor)
+
+    def get_cycle_vertices(self):
+        """
+        Returns the vertices that can never be sorted once the sort is exhausted, which are the vertices on a
+        cycle and the vertices reachable from a cycle. The list is empty if the graph is acyclic
+        - Time Complexity: O(n) where n is the number of vertices
+        - Space Complexity: O(n) where n is the number of vertices
+        """
+        return [vertex for vertex in self.graph.get_vertices() if self.in_degrees[vertex] > 0]
+
+
+class TaskSchedule:
+    """
+    Report of a task graph run, where timings are (start, end) seconds relative to the start of the run
+    and the critical path is the chain of dependent tasks with the largest total duration
+    """
+    def __init__(self):
+        self.results = {}
+        self.timings = {}
+        self.durations = {}
+        self.critical_path = []
+        self.critical_path_length = 0
+        self.total_time = 0
+
+def _run_timed_task(task, value):
+    # Runs inside the worker, so the duration excludes the time the task waited for a worker
+    start = time.perf_counter()
+    result = task(value)
+    return result, time.perf_counter() - start
+
+def run_task_graph(graph, task, max_workers=None, use_processes=False):
+    """
+    Run task(value) for every vertex of a Directed Acyclic Graph of tasks on a pool of workers, where an
+    edge u -> v means that v depends on u. Every ready wave of tasks runs in parallel and the dependents of
+    a task are released as soon as it finishes
+    - Time Complexity: O(n + m) scheduling work where n is the number of tasks and m is the number of edges
+    - Space Complexity: O(n) where n is the number of tasks
+
+    Note: At most max_workers tasks run at once (the number of CPUs if None). With use_processes the tasks
+    run on a process pool, so the task and the vertex values have to be picklable. A graph with a cycle is
+    rejected before any task runs
+    """
+    # Tasks may have side effects, so a cycle has to be found before the first task is submitted
+    if has_cycle(graph):
+        raise ValueError("The task graph has a cycle")
+
+    schedule = TaskSchedule()
+    topological_sort = TopologicalSort(graph)
+
+    # Longest duration of a dependency chain ending right before and at each task, used for the critical path
+    chain_before = {}
+    chain_through = {}
+    critical_predecessor = {}
+
+    worker_count = max_workers if max_workers != None else os.cpu_count() or 1
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=worker_count) as executor:
+        waiting = deque()
+        running = {}
+        run_start = time.perf_counter()
+
+        while True:
+            # Only hand tasks to the pool when a worker is free, so the recorded start is the real start
+            waiting.extend(topological_sort.get_ready())
+            while len(waiting) > 0 and len(running) < worker_count:
+                vertex = waiting.popleft()
+                schedule.timings[vertex] = (time.perf_counter() - run_start, None)
+                running[executor.submit(_run_timed_task, task, graph.get_value(vertex))] = vertex
+
+            if len(running) == 0:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                vertex = running.pop(future)
+                try:
+                    result, duration = future.result()
+                except BaseException:
+                    for other_future in running:
+                        other_future.cancel()
+                    raise
+
+                schedule.results[vertex] = result
+                schedule.durations[vertex] = duration
+                schedule.timings[vertex] = (schedule.timings[vertex][0], time.perf_counter() - run_start)
+
+                # Extend the longest dependency chain through this task to each of its dependents
+                chain_through[vertex] = chain_before.get(vertex, 0) + duration
+                for neighbor, _ in graph.get_neighbors(vertex):
+                    if chain_through[vertex] > chain_before.get(neighbor, -1):
+                        chain_before[neighbor] = chain_through[vertex]
+                        critical_predecessor[neighbor] = vertex
+
+                topological_sort.done(vertex)
+
+        schedule.total_time = time.perf_counter() - run_start
+
+    # Walk the critical path back from the task whose dependency chain finishes last
+    if len(chain_through) > 0:
+        current_vertex = max(chain_through, key=lambda vertex : chain_through[vertex])
+        schedule.critical_path_length = chain_through[current_vertex]
+        while current_vertex != None:
+            schedule.critical_path.append(current_vertex)
+            current_vertex = critical_predecessor.get(current_vertex)
+        schedule.critical_path.reverse()
+
+    return schedule
 
 if __name__ == "__main__":
     def get_test_unweighted_directed_graph():
@@ -298,6 +1753,36 @@ if __name__ == "__main__":
         graph.add_edge(Edge(e, a, 5))
         return graph
 
+    def sleep_task(value):
+        time.sleep(value / 100)
+        return value * 2
+
+    def get_test_task_graph():
+        # Tasks take value / 100 seconds, 2 and 3 run in the same wave and 1 -> 3 -> 4 is the critical path
+        graph = DirectedGraph()
+        vertices = [Vertex(value) for value in [1, 2, 3, 4]]
+        for vertex in vertices:
+            graph.add_vertex(vertex)
+        graph.add_edge(Edge(vertices[0], vertices[1]))
+        graph.add_edge(Edge(vertices[0], vertices[2]))
+        graph.add_edge(Edge(vertices[1], vertices[3]))
+        graph.add_edge(Edge(vertices[2], vertices[3]))
+        return graph
+
+    def get_test_grid_graph(size):
+        # Directed grid of size x size cells with edges to the right and downwards, ids are row * size + column
+        sources = []
+        targets = []
+        for row in range(size):
+            for column in range(size):
+                if column + 1 < size:
+                    sources.append(row * size + column)
+                    targets.append(row * size + column + 1)
+                if row + 1 < size:
+                    sources.append(row * size + column)
+                    targets.append((row + 1) * size + column)
+        return CSRGraph.from_arrays(sources, targets, values=range(size * size))
+
     class TestGraph(unittest.TestCase):
         def test_unweighted_directed_grap_all(self):
             search_algorithms = [BFS, DFS_iterative, DFS_recursive]
@@ -312,6 +1797,32 @@ if __name__ == "__main__":
             graph = get_test_weighted_undirected_graph()
             self.assertEqual(Kruskal(graph), [(2, 4), (2, 3), (0, 1), (4, 0)])
 
+        def test_prim_boruvka(self):
+            graph = get_test_weighted_undirected_graph()
+            self.assertEqual(Prim(graph), [(0, 1), (0, 4), (4, 2), (2, 3)])
+            self.assertEqual(Prim(CSRGraph.from_graph(graph)), Prim(graph))
+            self.assertEqual(Boruvka(graph), [(2, 4), (2, 3), (0, 1), (4, 0)])
+            self.assertEqual(Boruvka(graph, max_workers=2, chunk_size=3), Boruvka(graph))
+
+            # Every algorithm finds a spanning forest of the same total weight
+            graph.add_vertex(Vertex(5))
+            graph.add_vertex(Vertex(6))
+            graph.add_edge(Edge(graph.get_vertices()[5], graph.get_vertices()[6], 4))
+            weights = { frozenset((beginning.value, end.value)): weight for beginning, end, weight in graph.get_edges() }
+            for algorithm in [Kruskal, Prim, Boruvka]:
+                spanning_forest = algorithm(graph)
+                self.assertEqual(len(spanning_forest), 5)
+                self.assertEqual(sum(weights[frozenset(edge)] for edge in spanning_forest), 15)
+
+        def test_kruskals_any_values(self):
+            graph = UndirectedGraph()
+            vertices = [Vertex(value) for value in ['X', 'Y', 'Z', 'W']]
+            for vertex in vertices:
+                graph.add_vertex(vertex)
+            for beginning, end, weight in [(0, 1, 4), (1, 2, 1), (2, 0, 2), (2, 3, 7), (1, 3, 5)]:
+                graph.add_edge(Edge(vertices[beginning], vertices[end], weight))
+            self.assertEqual(Kruskal(graph), [('Y', 'Z'), ('Z', 'X'), ('Y', 'W')])
+
         def test_dijkstra(self):
             graph = UndirectedGraph()
             a = Vertex('A')
@@ -333,7 +1844,401 @@ if __name__ == "__main__":
             graph.add_edge(Edge(d, e, 11))
             graph.add_edge(Edge(e, a, 5))
             self.assertEqual(Dijkstra(graph, a), { a: 0, b: 3, c: 6, d: 8, e: 5 })
+
+        def test_dijkstra_search(self):
+            graph = get_test_weighted_undirected_graph()
+            a, b, c, d, e = graph.get_vertices()
+            distances, predecessors = Dijkstra_search(graph, a)
+            self.assertEqual(distances, { a: 0, b: 3, c: 6, d: 8, e: 5 })
+            self.assertEqual(list(map(lambda vertex : vertex.value, get_path(predecessors, d))), [0, 2, 3])
+
+            # Searching for the nearest targets only settles the vertices closer than them
+            distances, predecessors = Dijkstra_search(graph, a, [b, e])
+            self.assertEqual(distances, { a: 0, b: 3, e: 5 })
+            self.assertEqual(get_path(predecessors, e), [a, e])
+            self.assertEqual(predecessors.keys(), distances.keys())
+
+            # The array-backed path of a CSR graph gives the same dictionaries by vertex id
+            csr_graph = CSRGraph.from_graph(graph)
+            self.assertEqual(Dijkstra_search(csr_graph, 0), ({0: 0, 1: 3, 2: 6, 3: 8, 4: 5}, {0: None, 1: 0, 2: 0, 3: 2, 4: 0}))
+            self.assertEqual(Dijkstra_search(csr_graph, 0, [1, 4]), ({0: 0, 1: 3, 4: 5}, {0: None, 1: 0, 4: 0}))
+
+            graph.add_vertex(Vertex(5))
+            self.assertEqual(Dijkstra(graph, a)[graph.get_vertices()[-1]], sys.maxsize)
         
+        def test_bulk_construction(self):
+            edges = [(0, 1, 3), (0, 2, 6), (1, 2, 7), (1, 4, 8), (2, 3, 2), (2, 4, 1), (3, 4, 11), (4, 0, 5)]
+            graph = UndirectedGraph.from_edge_list(edges)
+            self.assertEqual(list(map(lambda vertex : vertex.value, graph.get_vertices())), [0, 1, 2, 4, 3])
+            self.assertEqual(Kruskal(graph), [(2, 4), (2, 3), (0, 1), (4, 0)])
+
+            graph = DirectedGraph.from_arrays([0, 0, 1], [1, 2, 2], values=['A', 'B', 'C'])
+            self.assertEqual(list(map(lambda vertex : vertex.value, Kahn(graph))), ['A', 'B', 'C'])
+            self.assertEqual(graph.get_vertices()[2].inDegree, 2)
+
+            # Building the CSR graph directly gives the same arrays as converting the adjacency list graph
+            expected = CSRGraph.from_graph(get_test_weighted_undirected_graph())
+            csr_graph = CSRGraph.from_arrays(*zip(*edges), directed=False)
+            self.assertEqual((csr_graph.offsets, csr_graph.targets, csr_graph.weights), (expected.offsets, expected.targets, expected.weights))
+            csr_graph = CSRGraph.from_edge_list([('A', 'B', 0.5), ('B', 'C', 2)])
+            self.assertEqual(list(csr_graph.values), ['A', 'B', 'C'])
+            self.assertEqual(list(csr_graph.get_neighbors(0)), [(1, 0.5)])
+
+        def test_shared_undirected_edges(self):
+            graph = get_test_weighted_undirected_graph()
+            a, b, c, d, e = graph.get_vertices()
+            self.assertIs(graph.get_vertex_edges(a)[0], graph.get_vertex_edges(b)[0])
+            self.assertEqual(graph.get_neighbors(e), [(b, 8), (c, 1), (d, 11), (a, 5)])
+            self.assertEqual(len(list(graph.get_edges())), 8)
+            self.assertRaises(AttributeError, setattr, a, 'visited', True)
+
+            interner = Interner(['A', 'B'])
+            self.assertEqual((interner.intern('C'), interner.intern('A')), (2, 0))
+            self.assertEqual((len(interner), interner.get_id('B'), interner.get_value(2)), (3, 1, 'C'))
+            self.assertTrue('C' in interner)
+
+        def test_read_edge_list(self):
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'edges.txt')
+                with open(path, 'w') as file:
+                    file.write("# beginning end weight\n0 1 3\n\n1 2 0.5\n2   0 -1\n")
+                self.assertEqual(list(read_edge_list(path, value_type=int)), [(0, 1, 3), (1, 2, 0.5), (2, 0, -1)])
+
+                path = os.path.join(directory, 'edges.csv')
+                with open(path, 'w') as file:
+                    file.write("A,B\nB,C\n")
+                csr_graph = CSRGraph.from_edge_list(read_edge_list(path, delimiter=','))
+                self.assertEqual(Kahn(csr_graph), [0, 1, 2])
+
+                path = os.path.join(directory, 'indented.csv')
+                with open(path, 'w') as file:
+                    file.write("  # beginning,end\nA,B\n")
+                self.assertEqual(list(read_edge_list(path, delimiter=',')), [('A', 'B')])
+
+                path = os.path.join(directory, 'malformed.txt')
+                with open(path, 'w') as file:
+                    file.write("0 1\n2\n")
+                with self.assertRaisesRegex(ValueError, "Line 2"):
+                    list(read_edge_list(path, value_type=int))
+                with open(path, 'w') as file:
+                    file.write("0 1 x\n")
+                with self.assertRaisesRegex(ValueError, "Line 1"):
+                    list(read_edge_list(path, value_type=int))
+
+                path = os.path.join(directory, 'empty.txt')
+                open(path, 'w').close()
+                self.assertEqual(list(read_edge_list(path)), [])
+
+        def test_csr_snapshot(self):
+            graph = get_test_unweighted_directed_graph()
+            csr_graph = CSRGraph.from_graph(graph)
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'graph.csr')
+                csr_graph.save(path)
+                snapshot = CSRGraph.load(path)
+                self.assertEqual(list(snapshot.values), ['A', 'B', 'C', 'D', 'E'])
+                self.assertEqual(list(snapshot.offsets), list(csr_graph.offsets))
+                self.assertEqual(snapshot.weights.format, 'q')
+                self.assertTrue(snapshot.directed)
+                self.assertEqual(snapshot.get_value(BFS(snapshot, 'E')), 'E')
+                self.assertEqual(Dijkstra(snapshot, 3), Dijkstra(csr_graph, 3))
+                self.assertEqual(TopologicalSort(snapshot).get_ready(), [3])
+
+                # Snapshots of snapshots and of graphs with implicit values round trip as well
+                snapshot.save(os.path.join(directory, 'copy.csr'))
+                snapshot.close()
+                self.assertEqual(list(CSRGraph.load(os.path.join(directory, 'copy.csr')).values), ['A', 'B', 'C', 'D', 'E'])
+
+                CSRGraph.from_arrays([0, 1], [1, 2], [0.5, 1.5], directed=False).save(path)
+                snapshot = CSRGraph.load(path)
+                self.assertEqual(snapshot.values, range(3))
+                self.assertFalse(snapshot.directed)
+                self.assertEqual(list(snapshot.get_neighbors(1)), [(0, 0.5), (2, 1.5)])
+                snapshot.close()
+
+                # Narrow weight arrays are widened so that the snapshot layout holds
+                CSRGraph.from_arrays([0, 1], [1, 2], array('i', [5, 7]), values=['a', 'b', 'c']).save(path)
+                snapshot = CSRGraph.load(path)
+                self.assertEqual((snapshot.weights.format, list(snapshot.weights)), ('q', [5, 7]))
+                self.assertEqual(list(snapshot.values), ['a', 'b', 'c'])
+                snapshot.close()
+
+                # Truncated snapshots are rejected instead of loading shorter arrays
+                CSRGraph.from_arrays([0, 1, 2, 3], [1, 2, 3, 0]).save(path)
+                with open(path, 'r+b') as file:
+                    file.truncate(os.path.getsize(path) - 16)
+                self.assertRaises(ValueError, CSRGraph.load, path)
+
+                with open(path, 'wb') as file:
+                    file.write(bytes(CSRGraph.SNAPSHOT_HEADER.size))
+                self.assertRaises(ValueError, CSRGraph.load, path)
+
+        def test_csr_graph(self):
+            graph = get_test_weighted_undirected_graph()
+            csr_graph = CSRGraph.from_graph(graph)
+            self.assertEqual(csr_graph.get_vertex_count(), 5)
+            self.assertEqual(csr_graph.get_edge_count(), 16)
+            self.assertEqual(list(csr_graph.get_neighbors(2)), [(0, 6), (1, 7), (3, 2), (4, 1)])
+            self.assertEqual(csr_graph.weights.typecode, 'q')
+            self.assertEqual(Kruskal(csr_graph), [(2, 4), (2, 3), (0, 1), (0, 4)])
+            self.assertEqual(Dijkstra(csr_graph, 0), { 0: 0, 1: 3, 2: 6, 3: 8, 4: 5 })
+
+            csr_graph = CSRGraph.from_graph(get_test_unweighted_directed_graph())
+            for algorithm in [BFS, DFS_iterative]:
+                self.assertEqual(algorithm(csr_graph, 'Z'), None)
+                self.assertEqual(csr_graph.get_value(algorithm(csr_graph, 'E')), 'E')
+
+        def test_bfs_levels(self):
+            graph = get_test_unweighted_directed_graph()
+            a, b, c, d, e = graph.get_vertices()
+            distances, parents = BFS_levels(graph, d)
+            self.assertEqual(distances, { d: 0, e: 1, c: 2, a: 2, b: 3 })
+            self.assertEqual(get_path(parents, b), [d, e, a, b])
+
+            csr_graph = CSRGraph.from_graph(graph)
+            distances, parents = BFS_levels(csr_graph, 0)
+            self.assertEqual(distances, { 0: 0, 1: 1, 2: 1, 4: 2 })
+            self.assertEqual(get_path(parents, 3), None)
+
+        def test_run_task_graph(self):
+            graph = get_test_task_graph()
+            schedule = run_task_graph(graph, sleep_task, max_workers=2)
+            self.assertEqual(list(map(lambda vertex : vertex.value, schedule.critical_path)), [1, 3, 4])
+            self.assertEqual(sorted(schedule.results.values()), [2, 4, 6, 8])
+            self.assertGreaterEqual(schedule.critical_path_length, 0.08)
+
+            # Tasks 2 and 3 are released together and run in parallel on the two workers
+            for vertex, (start, end) in schedule.timings.items():
+                self.assertLessEqual(start, end)
+            a, b, c, d = graph.get_vertices()
+            self.assertLess(schedule.timings[b][0], schedule.timings[c][1])
+            self.assertLess(schedule.timings[c][0], schedule.timings[b][1])
+            self.assertLessEqual(schedule.timings[a][1], min(schedule.timings[b][0], schedule.timings[c][0]))
+
+            schedule = run_task_graph(CSRGraph.from_graph(graph), abs, max_workers=2, use_processes=True)
+            self.assertEqual(schedule.results, { 0: 1, 1: 2, 2: 3, 3: 4 })
+
+            # No task runs when the graph has a cycle, not even the tasks upstream of it
+            graph = DirectedGraph.from_edge_list([('a', 'b'), ('b', 'c'), ('c', 'b')])
+            ran = []
+            self.assertRaises(ValueError, run_task_graph, graph, ran.append)
+            self.assertEqual(ran, [])
+
+        def test_point_to_point_searches(self):
+            graph = get_test_weighted_undirected_graph()
+            a, b, c, d, e = graph.get_vertices()
+            distance, path, _ = Dijkstra_bidirectional(graph, b, d)
+            self.assertEqual((distance, path), (9, [b, c, d]))
+            distance, path, _ = A_star(graph, b, d, lambda vertex : 0)
+            self.assertEqual((distance, path), (9, [b, c, d]))
+            self.assertEqual(Dijkstra_bidirectional(graph, a, a)[:2], (0, [a]))
+
+            directed_graph = get_test_unweighted_directed_graph()
+            a, b, c, d, e = directed_graph.get_vertices()
+            self.assertEqual(Dijkstra_bidirectional(directed_graph, d, b)[:2], (3, [d, e, a, b]))
+            self.assertEqual(Dijkstra_bidirectional(directed_graph, a, d)[:2], (sys.maxsize, None))
+            self.assertEqual(A_star(directed_graph, a, d, lambda vertex : 0)[:2], (sys.maxsize, None))
+
+        def test_point_to_point_settled_counts(self):
+            size = 30
+            graph = get_test_grid_graph(size)
+            source, target = 0, size * size - 1
+            distances, _ = Dijkstra_search(graph, source, [target])
+            self.assertEqual(distances[target], 2 * (size - 1))
+
+            # A* with the Manhattan distance heads for the corner instead of settling the whole grid
+            manhattan = lambda vertex : (size - 1 - vertex // size) + (size - 1 - vertex % size)
+            distance, path, settled_count = A_star(graph, source, target, manhattan)
+            self.assertEqual(distance, 2 * (size - 1))
+            self.assertEqual(len(path), 2 * size - 1)
+            self.assertLess(settled_count, len(distances) // 4)
+
+            middle = (size // 2) * size + size // 2
+            distances, _ = Dijkstra_search(graph, source, [middle])
+            distance, path, settled_count = Dijkstra_bidirectional(graph, source, middle, graph.transpose())
+            self.assertEqual((distance, path[0], path[-1]), (distances[middle], source, middle))
+            self.assertLess(settled_count, len(distances))
+
+        def test_dfs_events(self):
+            graph = get_test_unweighted_directed_graph()
+            a, b, c, d, e = graph.get_vertices()
+            events = list(DFS_events(graph))
+            self.assertEqual(events, [('discover', a, None), ('tree', a, b), ('discover', b, a), ('tree', b, c), ('discover', c, b),
+                                      ('tree', c, e), ('discover', e, c), ('back', e, c), ('back', e, a), ('finish', e, c),
+                                      ('finish', c, b), ('forward', b, e), ('finish', b, a), ('forward', a, c), ('finish', a, None),
+                                      ('discover', d, None), ('cross', d, e), ('finish', d, None)])
+            ids = {vertex: index for index, vertex in enumerate(graph.get_vertices())}
+            csr_events = [(event, ids[vertex], ids.get(other)) for event, vertex, other in events]
+            self.assertEqual(list(DFS_events(CSRGraph.from_graph(graph))), csr_events)
+            self.assertTrue(has_cycle(graph))
+            self.assertFalse(has_cycle(get_test_task_graph()))
+
+        def test_dfs_deep_path(self):
+            # A path far deeper than the recursion limit
+            size = 100000
+            graph = CSRGraph.from_arrays(range(size - 1), range(1, size))
+            self.assertEqual(DFS_iterative(graph, size - 1), size - 1)
+            self.assertEqual(sum(1 for event in DFS_events(graph, [0]) if event[0] == 'finish'), size)
+            self.assertFalse(has_cycle(graph))
+
+        def test_tarjan_condensation(self):
+            graph = get_test_unweighted_directed_graph()
+            a, b, c, d, e = graph.get_vertices()
+            self.assertEqual(Tarjan(graph), [[e, c, b, a], [d]])
+
+            # Cycles 0 -> 1 -> 2 -> 0 and 3 <-> 4 feed into the single vertex 5
+            edges = [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3), (1, 4), (4, 5), (0, 5)]
+            components, dag = condensation(DirectedGraph.from_edge_list(edges))
+            self.assertEqual([sorted(map(lambda vertex : vertex.value, component)) for component in components], [[0, 1, 2], [3, 4], [5]])
+            self.assertEqual(sorted((beginning.value, end.value) for beginning, end, _ in dag.get_edges()), [(0, 1), (0, 2), (1, 2)])
+            self.assertEqual(list(map(lambda vertex : vertex.value, Kahn(dag))), [0, 1, 2])
+
+            components, dag = condensation(CSRGraph.from_edge_list(edges))
+            self.assertEqual(list(map(sorted, components)), [[0, 1, 2], [3, 4], [5]])
+            self.assertEqual(dag.get_edge_count(), 3)
+
+            # A cycle far longer than the recursion limit is a single component
+            size = 100000
+            components, dag = condensation(CSRGraph.from_arrays(range(size), [(vertex + 1) % size for vertex in range(size)]))
+            self.assertEqual((len(components), len(components[0]), dag.get_edge_count()), (1, size, 0))
+
+        def test_articulation_points(self):
+            # Two triangles joined by the bridge 2 - 3, with the tail 5 - 6
+            edges = [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 3), (5, 6)]
+            graph = UndirectedGraph.from_edge_list(edges)
+            self.assertEqual(sorted(map(lambda vertex : vertex.value, articulation_points(graph))), [2, 3, 5])
+            self.assertEqual(sorted(articulation_points(CSRGraph.from_edge_list(edges, directed=False))), [2, 3, 5])
+            self.assertEqual(articulation_points(get_test_weighted_undirected_graph()), [])
+            self.assertEqual(articulation_points(CSRGraph.from_arrays([1], [0], directed=False)), [])
+            self.assertEqual(articulation_points(CSRGraph.from_arrays([1, 1], [0, 2], directed=False)), [1])
+
+        def test_many_source_shortest_paths(self):
+            graph = get_test_weighted_undirected_graph()
+            expected = [[0, 3, 6, 8, 5], [3, 0, 7, 9, 8], [6, 7, 0, 2, 1], [8, 9, 2, 0, 3], [5, 8, 1, 3, 0]]
+            self.assertEqual(Floyd_Warshall(graph), expected)
+
+            vertices = graph.get_vertices()
+            rows = dict(Dijkstra_many(graph, vertices))
+            self.assertEqual([rows[vertex] for vertex in vertices], expected)
+            rows = dict(Dijkstra_many(CSRGraph.from_graph(graph), range(5), max_workers=2, chunk_size=2))
+            self.assertEqual([rows[vertex] for vertex in range(5)], expected)
+
+            # Workers map the snapshot instead of receiving the arrays
+            directed_graph = CSRGraph.from_graph(get_test_unweighted_directed_graph())
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'graph.csr')
+                directed_graph.save(path)
+                snapshot = CSRGraph.load(path)
+                rows = dict(Dijkstra_many(snapshot, [3, 0], max_workers=2, chunk_size=1))
+                snapshot.close()
+            self.assertEqual(rows, { 3: [2, 3, 2, 0, 1], 0: [0, 1, 1, sys.maxsize, 2] })
+            self.assertEqual(Floyd_Warshall(directed_graph)[0], rows[0])
+
+        def test_interleaved_many_source_shortest_paths(self):
+            # Generators running at the same time in this process keep their own graphs
+            first_graph = CSRGraph.from_arrays([0, 1], [1, 2], [1, 1])
+            second_graph = CSRGraph.from_arrays([0, 1], [1, 2], [100, 100])
+            first_rows = Dijkstra_many(first_graph, [0, 1], chunk_size=1)
+            second_rows = Dijkstra_many(second_graph, [0])
+            self.assertEqual(next(first_rows), (0, [0, 1, 2]))
+            self.assertEqual(next(second_rows), (0, [0, 100, 200]))
+            self.assertEqual(next(first_rows), (1, [sys.maxsize, 0, 1]))
+
+        def test_dynamic_shortest_paths(self):
+            graph = get_test_unweighted_directed_graph()
+            a, b, c, d, e = graph.get_vertices()
+            shortest_paths = DynamicShortestPaths(graph, d)
+            self.assertEqual(shortest_paths.get_distance(b), 3)
+            self.assertEqual(shortest_paths.get_distance(d), 0)
+
+            # Insertions and decreases are repaired without a full search
+            shortcut = Edge(d, b, 1)
+            graph.add_edge(shortcut)
+            self.assertEqual(shortest_paths.get_path(b), [d, b])
+            self.assertEqual(shortest_paths.get_distance(c), 2)
+            graph.add_edge(Edge(b, c, 5))
+            self.assertEqual(shortest_paths.get_distance(c), 2)
+            graph.set_edge_weight(graph.get_vertex_edges(e)[0], 0)
+            self.assertEqual(shortest_paths.get_path(c), [d, e, c])
+            self.assertEqual(shortest_paths.get_distance(c), 1)
+            self.assertEqual(shortest_paths.full_searches, 1)
+
+            # Removing a tree edge searches again
+            graph.remove_edge(shortcut)
+            self.assertEqual(shortest_paths.get_distance(b), 3)
+            self.assertEqual(shortest_paths.full_searches, 2)
+            self.assertEqual(shortest_paths.distances, Dijkstra_search(graph, d)[0])
+
+            shortest_paths.close()
+            graph.add_edge(Edge(d, a, 1))
+            self.assertEqual(shortest_paths.get_distance(a), 2)
+
+            graph = get_test_weighted_undirected_graph()
+            a, b, c, d, e = graph.get_vertices()
+            shortest_paths = DynamicShortestPaths(graph, a)
+            graph.add_edge(Edge(d, a, 1))
+            self.assertEqual(shortest_paths.distances, { a: 0, b: 3, c: 3, d: 1, e: 4 })
+
+        def test_graph_stats(self):
+            graph = get_test_weighted_undirected_graph()
+            a, b, c, d, e = graph.get_vertices()
+            events = []
+            stats = GraphStats(lambda *event : events.append(event))
+            Dijkstra(graph, a, stats)
+            self.assertEqual((stats.vertices_settled, stats.edges_relaxed, stats.heap_operations), (5, 8, 10))
+            self.assertEqual(events[:3], [('settle', a), ('relax', a, b), ('relax', a, c)])
+
+            stats = GraphStats()
+            Kruskal(graph, stats)
+            self.assertEqual(stats.edges_relaxed, 4)
+            self.assertEqual(sorted(stats.phase_times), ['merge', 'sort'])
+
+            graph = get_test_unweighted_directed_graph()
+            for algorithm in [BFS, DFS_iterative]:
+                stats = GraphStats()
+                algorithm(graph, 'Z', stats=stats)
+                self.assertEqual((stats.vertices_settled, stats.edges_relaxed), (5, 8))
+
+            stats = GraphStats()
+            Kahn(get_test_task_graph(), stats)
+            self.assertEqual((stats.vertices_settled, stats.edges_relaxed, list(stats.phase_times)), (4, 4, ['count']))
+
+        def test_concurrent_searches(self):
+            csr_graph = CSRGraph.from_graph(get_test_unweighted_directed_graph())
+            results = []
+
+            # Every worker reuses its own state for all of its searches on the shared graph
+            def worker():
+                state = TraversalState(csr_graph)
+                for _ in range(200):
+                    for algorithm in [BFS, DFS_iterative, DFS_recursive]:
+                        results.append(csr_graph.get_value(algorithm(csr_graph, 'E', state)))
+                        results.append(algorithm(csr_graph, 'Z', state))
+                    results.append(Dijkstra_search(csr_graph, 3, state=state)[0])
+
+            workers = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+
+            self.assertEqual(len(results), 4 * 200 * 7)
+            self.assertEqual(results[:7], ['E', None, 'E', None, 'E', None, { 3: 0, 4: 1, 2: 2, 0: 2, 1: 3 }])
+            self.assertEqual(results.count('E'), 4 * 200 * 3)
+
+        def test_traversal_state_reset(self):
+            csr_graph = CSRGraph.from_graph(get_test_unweighted_directed_graph())
+            state = TraversalState(csr_graph)
+            state.visit(2)
+            self.assertTrue(state.is_visited(2))
+            state.reset()
+            self.assertFalse(state.is_visited(2))
+            state.generation = (1 << (8 * state.stamps.itemsize)) - 1
+            state.visit(2)
+            state.reset()
+            self.assertEqual(state.generation, 1)
+            self.assertFalse(state.is_visited(2))
+
         def test_kahn(self):
             graph = DirectedGraph()
             a = Vertex('A')
@@ -356,5 +2261,40 @@ if __name__ == "__main__":
             topological_sort = list(map(lambda vertex : vertex.value, Kahn(graph)))
             self.assertEqual(topological_sort, ['A', 'B', 'C', 'D', 'E'])
 
+            # The graph is left intact, so it can be sorted again or converted
+            self.assertEqual(len(graph.get_vertex_edges(a)), 2)
+            self.assertEqual(Kahn(CSRGraph.from_graph(graph)), [0, 1, 2, 3, 4])
+
+        def test_topological_sort_cycle(self):
+            graph = get_test_unweighted_directed_graph()
+            a, b, c, d, e = graph.get_vertices()
+            topological_sort = TopologicalSort(graph)
+            self.assertEqual(list(topological_sort), [d])
+            self.assertEqual(topological_sort.get_cycle_vertices(), [a, b, c, e])
+
+        def test_topological_sort_ready(self):
+            csr_graph = CSRGraph.from_graph(get_test_weighted_undirected_graph())
+            self.assertEqual(TopologicalSort(csr_graph).get_ready(), [])
+
+            graph = DirectedGraph()
+            vertices = [Vertex(value) for value in range(5)]
+            for vertex in vertices:
+                graph.add_vertex(vertex)
+            for beginning, end in [(0, 2), (1, 2), (2, 3), (2, 4)]:
+                graph.add_edge(Edge(vertices[beginning], vertices[end]))
+
+            topological_sort = TopologicalSort(CSRGraph.from_graph(graph))
+            self.assertEqual(topological_sort.get_ready(), [0, 1])
+            topological_sort.done(1)
+            self.assertEqual(topological_sort.get_ready(), [])
+            topological_sort.done(0)
+            self.assertEqual(topological_sort.get_ready(), [2])
+            topological_sort.done(2)
+            self.assertTrue(topological_sort.is_active())
+            self.assertEqual(topological_sort.get_ready(), [3, 4])
+            topological_sort.done(3)
+            topological_sort.done(4)
+            self.assertFalse(topological_sort.is_active())
+
         
     unittest.main()
\ No newline at end of file
@@ -24,6 +24,25 @@ class MinBinaryHeap:
         for i in range(len(array) // 2, -1, -1):
             self.heapify_down(i)
 
+    def __len__(self):
+        return len(self.heap)
+
+    def less(self, i, j):
+        """
+        Returns whether the element at index i has a higher priority than the element at index j
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        return self.heap[i] < self.heap[j]
+
+    def swap(self, i, j):
+        """
+        Swap the elements at the given indices
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+
     def heapify_up(self, index):
         """
         Swap the given child with its parent recursively until it is larger than its parent
@@ -31,8 +50,8 @@ class MinBinaryHeap:
         - Space Complexity: O(1)
         """
         parent_index = (index - 1) // 2
-        if parent_index >= 0 and self.heap[index] < self.heap[parent_index]:
-            self.heap[index], self.heap[parent_index] = self.heap[parent_index], self.heap[index]
+        if parent_index >= 0 and self.less(index, parent_index):
+            self.swap(index, parent_index)
             self.heapify_up(parent_index)
     
     def heapify_down(self, index):
@@ -48,7 +67,7 @@ class MinBinaryHeap:
 
             smaller_index = -1
             if left_child_index <= last_index and right_child_index <= last_index:
-                smaller_index = left_child_index if self.heap[left_child_index] < self.heap[right_child_index] else right_child_index
+                smaller_index = left_child_index if self.less(left_child_index, right_child_index) else right_child_index
             elif left_child_index <= last_index:
                 smaller_index = left_child_index
             elif right_child_index <= last_index:
@@ -57,8 +76,8 @@ class MinBinaryHeap:
             return smaller_index
         
         min_child_index = get_min_child_index(index)
-        if min_child_index >= 0 and self.heap[index] > self.heap[min_child_index]:
-            self.heap[index], self.heap[min_child_index] = self.heap[min_child_index], self.heap[index]
+        if min_child_index >= 0 and self.less(min_child_index, index):
+            self.swap(index, min_child_index)
             self.heapify_down(min_child_index)
     
     def insert(self, value):
@@ -95,6 +114,150 @@ class MinBinaryHeap:
         
         return self.heap[0]
 
+class IndexedMinBinaryHeap(MinBinaryHeap):
+    """
+    Indexed Minimum Binary Heap ADT where every item is its own handle
+
+    The heap stores items while their priorities and their current positions in
+    the underlying array are kept in separate maps. Knowing the position of an item
+    lets us change its priority or remove it in place instead of pushing duplicates
+
+    Note: Items must be hashable and unique within the heap
+    """
+    def __init__(self, pairs=None):
+        self.priorities = {}
+        self.positions = {}
+        super().__init__(pairs)
+
+    def build_heap(self, pairs):
+        """
+        Build the heap from the given (item, priority) pairs by calling heapify down on non-leaf children
+        - Time Complexity: O(n)
+        - Space Complexity: O(n)
+        """
+        self.heap = []
+        self.priorities = {}
+        self.positions = {}
+        for item, priority in pairs:
+            if item in self.positions:
+                raise ValueError("The given item already exists in the heap")
+            self.positions[item] = len(self.heap)
+            self.priorities[item] = priority
+            self.heap.append(item)
+
+        for i in range(len(self.heap) // 2, -1, -1):
+            self.heapify_down(i)
+
+    def less(self, i, j):
+        return self.priorities[self.heap[i]] < self.priorities[self.heap[j]]
+
+    def swap(self, i, j):
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.positions[self.heap[i]] = i
+        self.positions[self.heap[j]] = j
+
+    def contains(self, item):
+        """
+        Returns whether the given item is in the heap
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        return item in self.positions
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def get_priority(self, item):
+        """
+        Returns the current priority of the given item
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        return self.priorities[item]
+
+    def insert(self, item, priority):
+        """
+        Insert the given item with the given priority while preserving the heap property
+        - Time Complexity: O(logn)
+        - Space Complexity: O(1)
+        """
+        if item in self.positions:
+            raise ValueError("The given item already exists in the heap")
+
+        self.positions[item] = len(self.heap)
+        self.priorities[item] = priority
+        self.heap.append(item)
+        self.heapify_up(len(self.heap) - 1)
+
+    def remove_min(self):
+        """
+        Remove the item with the minimum priority and return it with its priority
+        - Time Complexity: O(logn)
+        - Space Complexity: O(1)
+        """
+        if len(self.heap) < 1:
+            return None
+
+        item = self.heap[0]
+        return item, self.remove(item)
+
+    def peek(self):
+        """
+        Returns the item with the minimum priority in the heap with its priority
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        if len(self.heap) < 1:
+            return None
+
+        return self.heap[0], self.priorities[self.heap[0]]
+
+    def decrease_key(self, item, priority):
+        """
+        Lower the priority of the given item and move it up to its new place
+        - Time Complexity: O(logn)
+        - Space Complexity: O(1)
+        """
+        if priority > self.priorities[item]:
+            raise ValueError("The given priority is larger than the current priority")
+
+        self.priorities[item] = priority
+        self.heapify_up(self.positions[item])
+
+    def increase_key(self, item, priority):
+        """
+        Raise the priority of the given item and move it down to its new place
+        - Time Complexity: O(logn)
+        - Space Complexity: O(1)
+        """
+        if priority < self.priorities[item]:
+            raise ValueError("The given priority is smaller than the current priority")
+
+        self.priorities[item] = priority
+        self.heapify_down(self.positions[item])
+
+    def remove(self, item):
+        """
+        Remove the given item from any position and return its priority
+        - Time Complexity: O(logn)
+        - Space Complexity: O(1)
+        """
+        index = self.positions[item]
+        last_index = len(self.heap) - 1
+        if index != last_index:
+            self.swap(index, last_index)
+
+        self.heap.pop()
+        del self.positions[item]
+        priority = self.priorities.pop(item)
+
+        # The last item moved into the gap might belong above or below it
+        if index < len(self.heap):
+            self.heapify_up(index)
+            self.heapify_down(index)
+
+        return priority
+
 if __name__ == "__main__":
     def get_test_heap():
         heap = MinBinaryHeap()
@@ -132,5 +295,30 @@ if __name__ == "__main__":
             heap.insert(44)
             heap.insert(47)
             self.assertEqual(heap.peek(), 44)
-    
+
+        def test_indexed_decrease_increase_key(self):
+            heap = IndexedMinBinaryHeap([('A', 10), ('B', 50), ('C', 20), ('D', 5), ('E', 30)])
+            self.assertEqual(heap.peek(), ('D', 5))
+            heap.decrease_key('B', 1)
+            self.assertEqual(heap.peek(), ('B', 1))
+            heap.increase_key('B', 100)
+            heap.increase_key('D', 25)
+            self.assertEqual(heap.remove_min(), ('A', 10))
+            self.assertEqual(heap.remove_min(), ('C', 20))
+            self.assertEqual(heap.remove_min(), ('D', 25))
+            self.assertRaises(ValueError, heap.decrease_key, 'E', 40)
+
+        def test_indexed_remove_contains(self):
+            heap = IndexedMinBinaryHeap()
+            for item, priority in [('A', 10), ('B', 50), ('C', 20), ('D', 5), ('E', 30)]:
+                heap.insert(item, priority)
+            self.assertTrue('C' in heap)
+            self.assertEqual(heap.remove('C'), 20)
+            self.assertFalse(heap.contains('C'))
+            self.assertEqual(heap.remove('D'), 5)
+            self.assertEqual(len(heap), 3)
+            self.assertRaises(ValueError, heap.insert, 'A', 1)
+            self.assertEqual([heap.remove_min()[0] for _ in range(3)], ['A', 'E', 'B'])
+            self.assertEqual(heap.remove_min(), None)
+
     unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import random
+import sys
+import time
+from itertools import accumulate
+
+from binaryTree import BinarySearchTree, AVLTree, RedBlackTree, Treap
+
+def sequential_keys(size):
+    """
+    Returns the keys 0, 1, ..., size - 1 in increasing order, the worst case of a Binary Search Tree
+    """
+    return list(range(size))
+
+def random_keys(size):
+    """
+    Returns the keys 0, 1, ..., size - 1 in a random order
+    """
+    keys = list(range(size))
+    random.shuffle(keys)
+    return keys
+
+def zipfian_keys(size, exponent=1.1):
+    """
+    Returns size keys drawn from 0, 1, ..., size - 1 where the k-th key is drawn with a probability
+    proportional to 1 / (k + 1) ^ exponent, so a few hot keys are repeated many times
+    """
+    cumulative_weights = list(accumulate(1 / (k + 1) ** exponent for k in range(size)))
+    return random.choices(range(size), cum_weights=cumulative_weights, k=size)
+
+def benchmark(tree_type, keys, seed=221):
+    """
+    Set, look up and then remove the given keys in a new tree of the given type, returning the throughput
+    in operations per second and the rotations per operation. A set of an existing key is counted as an
+    update and a remove of a missing key as a miss, so that repeated keys do not inflate the inserts and
+    removes of skewed streams
+
+    Note: Every call is timed on its own to tell the kinds apart, so all throughputs include the same
+    timer overhead. The treap draws its priorities from its own generator seeded with the given seed
+    """
+    tree = tree_type(seed=seed) if tree_type is Treap else tree_type()
+    times = {'insert': 0, 'update': 0, 'lookup': 0, 'remove': 0, 'miss': 0}
+    counts = dict.fromkeys(times, 0)
+    rotations = {'insert': 0, 'remove': 0}
+
+    def run(operation, key, changed, unchanged):
+        size = len(tree)
+        tree_rotations = tree.rotations
+        start = time.perf_counter()
+        operation(key)
+        elapsed = time.perf_counter() - start
+        kind = changed if len(tree) != size else unchanged
+        times[kind] += elapsed
+        counts[kind] += 1
+        if kind in rotations:
+            rotations[kind] += tree.rotations - tree_rotations
+
+    for key in keys:
+        run(lambda key : tree.set(key, key), key, 'insert', 'update')
+    for key in keys:
+        run(tree.get, key, 'lookup', 'lookup')
+    for key in keys:
+        run(tree.remove, key, 'remove', 'miss')
+
+    results = {}
+    for kind in times:
+        results[kind] = counts[kind] / times[kind] if counts[kind] > 0 else None
+    for kind in rotations:
+        results[kind + ' rotations'] = rotations[kind] / counts[kind] if counts[kind] > 0 else None
+    results['inserts'] = counts['insert']
+    return results
+
+def run_benchmarks(size, seed=221):
+    """
+    Print the results of every tree under sequential, random and Zipfian key streams of the given size
+    """
+    random.seed(seed)
+    streams = [('sequential', sequential_keys(size)), ('random', random_keys(size)), ('zipfian', zipfian_keys(size))]
+    tree_types = [BinarySearchTree, AVLTree, RedBlackTree, Treap]
+    columns = ['inserts', 'insert', 'update', 'lookup', 'remove', 'miss', 'insert rotations', 'remove rotations']
+
+    def format_result(column, result):
+        if result == None:
+            return "%18s" % '-'
+        if column == 'inserts':
+            return "%18d" % result
+        if column.endswith('rotations'):
+            return "%18.3f" % result
+        return "%16.0f/s" % result
+
+    print("%-12s %-18s" % ('stream', 'tree') + "".join("%18s" % column for column in columns))
+    for stream_name, keys in streams:
+        for tree_type in tree_types:
+            # The treap priorities use a seed of their own, independent of the generator of the keys
+            results = benchmark(tree_type, keys, seed + 1)
+            print("%-12s %-18s" % (stream_name, tree_type.__name__) + "".join(format_result(column, results[column]) for column in columns))
+
+# Testing, run with --benchmark [size] to print the benchmark instead
+if __name__ == "__main__":
+    class TestTreeBenchmark(unittest.TestCase):
+        def test_zipfian_counts(self):
+            random.seed(221)
+            keys = zipfian_keys(300)
+            for tree_type in [BinarySearchTree, AVLTree, RedBlackTree, Treap]:
+                results = benchmark(tree_type, keys)
+                self.assertEqual(results['inserts'], len(set(keys)))
+                self.assertLess(results['inserts'], len(keys))
+                self.assertNotEqual(results['update'], None)
+                self.assertNotEqual(results['miss'], None)
+
+        def test_sequential_counts(self):
+            results = benchmark(AVLTree, sequential_keys(100))
+            self.assertEqual(results['inserts'], 100)
+            self.assertEqual((results['update'], results['miss']), (None, None))
+            self.assertGreater(results['insert rotations'], 0)
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--benchmark':
+        # The plain Binary Search Tree takes quadratic time on sequential keys, so keep the default size modest
+        run_benchmarks(int(sys.argv[2]) if len(sys.argv) > 2 else 5000)
+    else:
+        unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from array import array
+
+class DisjointSet:
+    """
+    Disjoint Set (Union-Find) base class implementing the algorithm once, where the subclasses only provide
+    the storage: the parents and ranks indexed by key, and the count of sets
+
+    Note: Union by rank keeps every tree O(logn) high and path halving flattens the trees while searching,
+          which together make each operation take nearly constant amortized time
+    """
+    def __init__(self):
+        raise NotImplementedError()
+
+    def find(self, key):
+        """
+        Return the representative of the set containing the given key, pointing every other node on the
+        way to its grandparent
+        - Time Complexity: O(a(n)) amortized where a is the inverse Ackermann function
+        - Space Complexity: O(1)
+        """
+        parents = self.parents
+        while parents[key] != key:
+            parents[key] = parents[parents[key]]
+            key = parents[key]
+        return key
+
+    def union(self, x, y):
+        """
+        Merge the sets containing the given keys by linking the root of smaller rank under the other root
+        Returns whether the keys were in different sets
+        - Time Complexity: O(a(n)) amortized where a is the inverse Ackermann function
+        - Space Complexity: O(1)
+        """
+        x_root = self.find(x)
+        y_root = self.find(y)
+        if x_root == y_root:
+            return False
+
+        if self.ranks[x_root] < self.ranks[y_root]:
+            x_root, y_root = y_root, x_root
+        self.parents[y_root] = x_root
+        if self.ranks[x_root] == self.ranks[y_root]:
+            self.ranks[x_root] += 1
+
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+class DisjointSetDict(DisjointSet):
+    """
+    Disjoint Set (Union-Find) storage using dictionaries, where the keys can be any hashable value
+    """
+    def __init__(self, keys=()):
+        self.parents = {}
+        self.ranks = {}
+        self.count = 0
+        for key in keys:
+            self.add(key)
+
+    def add(self, key):
+        """
+        Add the given key as a new set of its own
+        - Time Complexity: O(1)
+        - Space Complexity: O(1)
+        """
+        if key not in self.parents:
+            self.parents[key] = key
+            self.ranks[key] = 0
+            self.count += 1
+
+class DisjointSetArray(DisjointSet):
+    """
+    Disjoint Set (Union-Find) storage using typed arrays, where the keys are the integers 0..n-1
+
+    Note: Each key costs 9 bytes instead of two dictionary entries, and a rank never exceeds logn so a
+          single byte is enough to store it
+    """
+    def __init__(self, size):
+        self.parents = array('q', range(size))
+        self.ranks = array('B', bytes(size))
+        self.count = size
+
+# Testing
+if __name__ == "__main__":
+    class TestDisjointSet(unittest.TestCase):
+        def test_disjoint_set_dict(self):
+            disjoint_set = DisjointSetDict(['A', 'B', 'C', 'D'])
+            self.assertFalse(disjoint_set.connected('A', 'B'))
+            self.assertTrue(disjoint_set.union('A', 'B'))
+            self.assertTrue(disjoint_set.union('C', 'D'))
+            self.assertFalse(disjoint_set.union('B', 'A'))
+            self.assertEqual(disjoint_set.count, 2)
+            disjoint_set.add('E')
+            self.assertTrue(disjoint_set.union('D', 'B'))
+            self.assertTrue(disjoint_set.connected('A', 'C'))
+            self.assertFalse(disjoint_set.connected('A', 'E'))
+            self.assertEqual(disjoint_set.count, 2)
+
+        def test_disjoint_set_array_long_chain(self):
+            # Linking a long chain would overflow the recursion limit with a recursive find
+            size = 100000
+            disjoint_set = DisjointSetArray(size)
+            for i in range(size - 1):
+                disjoint_set.union(i, i + 1)
+            self.assertEqual(disjoint_set.count, 1)
+            self.assertTrue(disjoint_set.connected(0, size - 1))
+            self.assertLessEqual(max(disjoint_set.ranks), 17)
+
+    unittest.main()